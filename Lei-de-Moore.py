@@ -4,63 +4,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-#matemática
-def calcular_mmq_detalhado():
-    # 1. Dados OTIMIZADOS da Lei de Moore
-    x_ano = np.array([1971, 1974, 1978, 1982, 1985, 1989, 1993, 1997, 2000, 2003, 2006], dtype=np.float64)
-    N = np.array([2300, 5000, 29000, 120000, 275000, 1200000, 3100000, 7500000, 42000000, 100000000, 200000000],
-                 dtype=np.float64)
-    n_pontos = len(x_ano)
-
-    # 2. Linearização e Centralização
-    y_log = np.log10(N)
-
-    x_medio = np.mean(x_ano)
-    t = x_ano - x_medio
-
-    # 3. Cálculo dos Somatórios
-    sum_t = np.sum(t)
-    sum_t2 = np.sum(t ** 2)
-    sum_y = np.sum(y_log)
-    sum_ty = np.sum(t * y_log)
-
-    # 4. Solução do Sistema Simplificado
-    A_angular = sum_ty / sum_t2
-    B_t_linear = sum_y / n_pontos
-
-    # 5. Parâmetros MMQ:
-    beta = A_angular
-    B_linear = B_t_linear - (A_angular * x_medio)
-    alpha = 10 ** B_linear
-
-    # Retorna string de memória de cálculo
-    detalhes_calculo = (
-        f"PASSO 1: CENTRALIZAÇÃO DE TEMPO (Novos Dados)\n"
-        f"--------------------------------------------\n"
-        f"Média dos Anos (x_medio) = {x_medio:.6f}\n"
-        f"Nova variável: t = Ano - {x_medio:.6f}\n\n"
-        f"PASSO 2: TABELA DE SOMATÓRIOS (n={n_pontos})\n"
-        f"--------------------------------------------\n"
-        f"Σ t    = {sum_t:.6f} (~0)\n"
-        f"Σ t²   = {sum_t2:,.4f}\n"
-        f"Σ y    = {sum_y:.6f}  (onde y = log10(N))\n"
-        f"Σ t·y  = {sum_ty:,.6f}\n\n"
-        f"PASSO 3: SOLUÇÃO DO SISTEMA SIMPLIFICADO\n"
-        f"--------------------------------------------\n"
-        f"A (Angular/Inclinação) = Σ t·y / Σ t² = {A_angular:.6f}\n"
-        f"B_t (Intercepto em t=0) = Σ y / n = {B_t_linear:.6f}\n\n"
-        f"PASSO 4: MODELO FINAL\n"
-        f"--------------------------------------------\n"
-        f"Intercepto original (B) = B_t - A * x_medio = {B_linear:.6f}\n"
-        f"alpha = 10^B = {alpha:.4e}\n"
-        f"Equação: N = {alpha:.4e} * 10^({A_angular:.5f} * Ano)"
-    )
-
-    return x_ano, N, y_log, alpha, beta, B_linear, detalhes_calculo
-
-
-def prever(ano, alpha, beta):
-    return alpha * (10 ** (beta * ano))
+from calculo_numerico.regressao import calcular_mmq_detalhado, prever, bootstrap_mmq, intervalos_confianca
 
 #interface
 class MooreAppStepByStep:
@@ -75,9 +19,21 @@ class MooreAppStepByStep:
         style.configure("Mono.TLabel", font=("Courier New", 14), background="#f0f0f0")
 
         self.x, self.y_real, self.y_log, self.alpha, self.beta, self.B_linear, self.texto_detalhes = calcular_mmq_detalhado()
+        self.beta_b, self.B_linear_b = bootstrap_mmq(self.x, self.y_log)
+        self.texto_detalhes += self.texto_incerteza()
 
         self.criar_abas()
 
+    def texto_incerteza(self):
+        ic = intervalos_confianca(self.beta_b, self.B_linear_b, [])
+        return (
+            f"\n\nPASSO 5: INCERTEZA (Bootstrap, {len(self.beta_b)} reamostras)\n"
+            f"--------------------------------------------\n"
+            f"IC {ic['nivel']:.0%} de beta = [{ic['beta'][0]:.6f}, {ic['beta'][1]:.6f}]\n"
+            f"Tempo de duplicação = log10(2) / beta = {np.log10(2) / self.beta:.3f} anos\n"
+            f"IC {ic['nivel']:.0%} da duplicação = [{ic['duplicacao'][0]:.3f}, {ic['duplicacao'][1]:.3f}] anos"
+        )
+
     def criar_abas(self):
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill="both", expand=True, padx=10, pady=10)
@@ -113,7 +69,10 @@ class MooreAppStepByStep:
 
         x_line = np.linspace(1970, 2025, 100)
         y_line_log = self.beta * x_line + self.B_linear
+        ic = intervalos_confianca(self.beta_b, self.B_linear_b, x_line)
 
+        ax1.fill_between(x_line, ic['log_inf'], ic['log_sup'], color='blue', alpha=0.2,
+                         label=f"IC {ic['nivel']:.0%} (Bootstrap)")
         ax1.scatter(self.x, self.y_log, color='red', s=80, label='Dados Originais (Log)')
         ax1.plot(x_line, y_line_log, color='blue', linewidth=3, label='Reta MMQ')
         ax1.set_title("Linearização (Log10)", fontsize=14)
@@ -121,6 +80,8 @@ class MooreAppStepByStep:
         ax1.legend()
 
         y_line_exp = prever(x_line, self.alpha, self.beta)
+        ax2.fill_between(x_line, ic['N_inf'], ic['N_sup'], color='green', alpha=0.2,
+                         label=f"IC {ic['nivel']:.0%} (Bootstrap)")
         ax2.scatter(self.x, self.y_real, color='red', s=80, label='Dados Reais')
         ax2.plot(x_line, y_line_exp, color='green', linewidth=3, label='Curva Ajustada')
         ax2.set_title("Curva Exponencial Final", fontsize=14)
@@ -145,7 +106,9 @@ class MooreAppStepByStep:
         try:
             ano = float(self.ent_ano.get())
             res = prever(ano, self.alpha, self.beta)
-            self.lbl_res.config(text=f"Em {int(ano)}: {res:.2e} transistores")
+            ic = intervalos_confianca(self.beta_b, self.B_linear_b, ano)
+            self.lbl_res.config(text=f"Em {int(ano)}: {res:.2e} transistores "
+                                     f"(IC {ic['nivel']:.0%}: {ic['N_inf'][0]:.2e} a {ic['N_sup'][0]:.2e})")
         except ValueError:
             messagebox.showerror("Erro", "Ano inválido")
 
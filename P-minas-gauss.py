@@ -2,49 +2,7 @@ import tkinter as tk
 from tkinter import messagebox
 import numpy as np
 
-
-#parte matemática do código
-def resolver_gauss_manual(A_in, B_in):
-    A = np.copy(A_in)
-    b = np.copy(B_in)
-    n = len(b)
-
-    for k in range(n - 1):
-        indice_max = k
-        valor_max = abs(A[k, k])
-
-        for i in range(k + 1, n):
-            if abs(A[i, k]) > valor_max:
-                valor_max = abs(A[i, k])
-                indice_max = i
-
-        if valor_max == 0:
-            raise ValueError("O sistema não tem solução única (Matriz Singular).")
-
-        if indice_max != k:
-            A[[k, indice_max]] = A[[indice_max, k]]
-            b[[k, indice_max]] = b[[indice_max, k]]
-
-        for i in range(k + 1, n):
-            fator = A[i, k] / A[k, k]
-
-            A[i, k:] = A[i, k:] - fator * A[k, k:]
-
-            b[i] = b[i] - fator * b[k]
-
-    if A[n - 1, n - 1] == 0:
-        raise ValueError("O sistema não tem solução única (Matriz Singular).")
-
-    x = np.zeros(n)
-
-    for i in range(n - 1, -1, -1):
-        soma_conhecidos = 0
-        for j in range(i + 1, n):
-            soma_conhecidos += A[i, j] * x[j]
-
-        x[i] = (b[i] - soma_conhecidos) / A[i, i]
-
-    return x
+from calculo_numerico.sistemas import resolver_gauss_manual, resolver_gauss_refinado
 
 
 #parte gráfica
@@ -52,7 +10,7 @@ class AppMinas(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Problema das Minas")
-        self.geometry("550x480")
+        self.geometry("550x530")
         self.resizable(False, False)
 
         self.font_label = ("Arial", 10, "bold")
@@ -98,6 +56,10 @@ class AppMinas(tk.Tk):
         tk.Label(self, text="* Insira os valores de A como inteiros (ex: 55 para 55%)",
                  font=("Arial", 8, "italic"), fg="gray").pack()
 
+        self.precisao_mista = tk.BooleanVar(value=False)
+        tk.Checkbutton(self, text="Precisão mista (fatoração float32 + refinamento float64)",
+                       variable=self.precisao_mista, font=self.font_entry).pack(pady=(10, 0))
+
         frame_botoes = tk.Frame(self)
         frame_botoes.pack(pady=20)
 
@@ -139,7 +101,12 @@ class AppMinas(tk.Tk):
                 if not val_b_str: val_b_str = "0"
                 B[i] = float(val_b_str)
 
-            x = resolver_gauss_manual(A, B)
+            if self.precisao_mista.get():
+                refinado = resolver_gauss_refinado(A, B, medir_speedup=True)
+                x = refinado["x"]
+            else:
+                refinado = None
+                x = resolver_gauss_manual(A, B)
 
             texto = "SOLUÇÃO:\n\n"
             texto += f"  Mina 1: {x[0]:.2f} m³\n"
@@ -149,6 +116,12 @@ class AppMinas(tk.Tk):
             b_calc = np.dot(A, x)
             erro = np.linalg.norm(b_calc - B)
             texto += f"\n  (Erro residual: {erro:.2e})"
+            if refinado is not None:
+                if refinado["fallback_float64"]:
+                    texto += "\n  Refinamento estagnou: resolvido em float64"
+                else:
+                    texto += f"\n  Passos de refinamento: {refinado['passos_refinamento']}"
+                texto += f"\n  Speedup vs float64: {refinado['speedup']:.2f}x"
 
             self.lbl_resultado.config(text=texto, fg="black")
 
@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import messagebox
 import math
 
+from calculo_numerico.sistemas import gauss_seidel
+
 
 class TrussSolverVisual:
     def __init__(self, root):
@@ -160,35 +162,11 @@ class TrussSolverVisual:
                 A.append(row)
 
             # Gauss-Seidel Loop
-            converged = False
-            iters = 0
-
-            for k in range(max_iter):
-                x_old = x[:]
-                max_err = 0.0
-
-                for i in range(n):
-                    sigma = 0
-                    for j in range(n):
-                        if j != i: sigma += A[i][j] * x[j]
-
-                    if abs(A[i][i]) < 1e-9:
-                        messagebox.showerror("Erro", f"Divisão por zero na linha {i + 1}")
-                        return
-
-                    x[i] = (B[i] - sigma) / A[i][i]
-
-                    if abs(x[i]) > 1e-9:
-                        err = abs((x[i] - x_old[i]) / x[i])
-                    else:
-                        err = abs(x[i] - x_old[i])
-
-                    if err > max_err: max_err = err
-
-                if max_err < tol:
-                    converged = True
-                    iters = k + 1
-                    break
+            try:
+                x, converged, iters, max_err = gauss_seidel(A, B, x, tol, max_iter)
+            except ValueError as ve:
+                messagebox.showerror("Erro", str(ve))
+                return
 
             # --- EXIBIR RESULTADOS NA TABELA ---
             if converged:
@@ -4,6 +4,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+from calculo_numerico.quadratura import regra_trapezios, regra_simpson
+
 
 class NavioInterativoApp:
     def __init__(self, root):
@@ -98,36 +100,15 @@ class NavioInterativoApp:
             return
 
         # --- CÁLCULO 1: Regra dos Trapézios Repetida ---
-        # Formula: h/2 * (y_inicial + 2*soma_meio + y_final)
-        area_trap = (h / 2) * (y[0] + 2 * np.sum(y[1:-1]) + y[-1])
+        area_trap = regra_trapezios(h, y)
 
         # --- CÁLCULO 2: Regra de Simpson (Adaptativa) ---
-        area_simp = 0
-        info_msg = ""
+        area_simp = regra_simpson(h, y)
 
         # Verifica paridade dos intervalos
         if n_intervalos % 2 == 0:
-            # Caso ideal: Número par de intervalos -> Simpson Puro
-            # Formula: h/3 * (y0 + 4*Impares + 2*Pares + yn)
-            soma_impares = np.sum(y[1:-1:2])  # Índices 1, 3, 5...
-            soma_pares = np.sum(y[2:-1:2])  # Índices 2, 4, 6...
-            area_simp = (h / 3) * (y[0] + 4 * soma_impares + 2 * soma_pares + y[-1])
             info_msg = "Método: Simpson 1/3 Puro (N par)"
-
         else:
-            # Caso da questão: Número ímpar de intervalos -> Simpson Misto
-            # Estratégia: Simpson até o penúltimo ponto + Trapézio no último
-
-            # Parte A: Simpson (0 até n-1)
-            y_simp = y[:-1]  # Remove o último ponto
-            soma_impares = np.sum(y_simp[1:-1:2])
-            soma_pares = np.sum(y_simp[2:-1:2])
-            area_parte_simp = (h / 3) * (y_simp[0] + 4 * soma_impares + 2 * soma_pares + y_simp[-1])
-
-            # Parte B: Trapézio (último intervalo)
-            area_parte_trap = (h / 2) * (y[-2] + y[-1])
-
-            area_simp = area_parte_simp + area_parte_trap
             info_msg = f"Atenção: N={n_intervalos} (ímpar).\nMétodo Misto aplicado:\nSimpson (0-{n_intervalos - 1}) + Trapézio ({n_intervalos - 1}-{n_intervalos})"
 
         # Atualiza Labels
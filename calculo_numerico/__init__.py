@@ -0,0 +1,36 @@
+# Núcleo numérico dos trabalhos. Nenhum módulo depende de tkinter/matplotlib, então o pacote
+# pode ser importado em máquinas sem display:
+#   sistemas   -> eliminação de Gauss (Problema das Minas), LU em precisão mista e Gauss-Seidel (Treliça)
+#   despacho   -> escolha do solver pela estrutura da matriz (banda, tridiagonal, esparsa, densa)
+#   trelicas   -> geometria das treliças e forças nas barras pelo método dos nós
+#   quadratura -> regras dos Trapézios e de Simpson (Área do Navio)
+#   regressao  -> MMQ exponencial, bootstrap e ajuste de várias séries (Lei de Moore)
+# As interfaces gráficas ficam nos scripts da raiz; o processamento em lote está em cli.py.
+#
+# Os nomes abaixo são reexportados sob demanda: `from calculo_numerico import resolver_gauss_manual`
+# carrega só calculo_numerico.sistemas, sem puxar despacho/trelicas/regressao junto.
+import importlib
+
+_EXPORTACOES = {
+    "sistemas": ["resolver_gauss_manual", "gauss_seidel", "fatorar_lu", "resolver_lu", "resolver_gauss_refinado",
+                 "matriz_para_banda", "fatorar_banda", "resolver_banda", "resolver_thomas", "gauss_seidel_esparso"],
+    "despacho": ["inspecionar_matriz", "escolher_metodo", "resolver_sistema"],
+    "trelicas": ["trelica_exemplo", "gerar_trelica_cadeia", "forcas_trelica"],
+    "quadratura": ["regra_trapezios", "regra_simpson"],
+    "regressao": ["calcular_mmq_detalhado", "prever", "bootstrap_mmq", "intervalos_confianca",
+                  "ajustar_mmq_multiplas", "ajustar_mmq_agrupado"],
+}
+_MODULO_DE = {nome: modulo for modulo, nomes in _EXPORTACOES.items() for nome in nomes}
+__all__ = list(_MODULO_DE)
+
+
+def __getattr__(nome):
+    if nome not in _MODULO_DE:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(importlib.import_module(f"{__name__}.{_MODULO_DE[nome]}"), nome)
+    globals()[nome] = valor  # Próximos acessos não passam mais por aqui
+    return valor
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,5 @@
+import sys
+
+from calculo_numerico.cli import main
+
+sys.exit(main())
@@ -0,0 +1,252 @@
+# Benchmarks dos núcleos numéricos em vários tamanhos de problema.
+#
+# Cada kernel tem um gerador de entradas sintéticas (do exemplo dos trabalhos até ~10^6) e é medido
+# em tempo (melhor de várias repetições), pico de memória (tracemalloc, em uma execução separada)
+# e iterações quando o método é iterativo. Os resultados viram uma linha de base em JSON, que pode
+# ser comparada com uma execução anterior para apontar regressões acima de um limiar.
+#
+# Os kernels de sistemas densos não chegam a 10^6: a matriz ocupa 8·n² bytes (8 TB com n = 10^6)
+# e a eliminação custa O(n³). gauss para em 300 (~0.25 s por execução, em laços Python) e
+# gauss_refinado / gauss_seidel em 1000 (~0.6 s; com 3000 o refinado passa de 15 s), para a
+# suíte completa caber em poucos minutos. Os despachos em banda vão até 3000 pelo mesmo motivo:
+# o gerador monta a matriz densa antes de o despacho encontrar a banda.
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from calculo_numerico.sistemas import resolver_gauss_manual, resolver_gauss_refinado, gauss_seidel
+from calculo_numerico.despacho import resolver_sistema
+from calculo_numerico.trelicas import trelica_exemplo, gerar_trelica_cadeia, forcas_trelica
+from calculo_numerico.quadratura import regra_trapezios, regra_simpson
+from calculo_numerico.regressao import (ANOS_MOORE, TRANSISTORES_MOORE, calcular_mmq_detalhado, prever)
+
+TEMPO_MIN_S = 0.2  # Repete cada caso até somar pelo menos este tempo...
+REPETICOES_MAX = 20  # ...ou atingir este número de repetições
+REPETICOES_MIN = 5  # Mesmo nos casos lentos, para a mediana comparada não ser uma execução só
+LIMIAR_REGRESSAO = 0.25  # 25% mais lento (ou mais memória) que a linha de base
+RUIDO_TEMPO_S = 50e-6  # Diferenças de tempo menores que isto são ruído de medição
+RUIDO_MEMORIA_BYTES = 4096  # Idem para o pico de memória (tracemalloc varia algumas centenas de bytes)
+COLUNAS_RESULTADO = ["kernel", "tamanho", "tempo_s", "tempo_mediano_s", "repeticoes", "memoria_pico_bytes",
+                     "iteracoes"]
+COLUNAS_COMPARACAO = ["kernel", "tamanho", "razao_tempo", "razao_memoria", "regressao"]
+
+
+#geradores de entradas
+def gerar_sistema(n, semente=0):
+    # Diagonal dominante: Gauss não precisa trocar linhas à toa e Gauss-Seidel converge
+    if n == 3:
+        return np.array([[55, 25, 25], [30, 45, 20], [15, 30, 55]]) / 100.0, np.array([4800.0, 5800.0, 5700.0])
+    rng = np.random.default_rng(semente)
+    A = rng.uniform(-1, 1, size=(n, n))
+    A[np.diag_indices(n)] = np.sum(np.abs(A), axis=1) + 1
+    return A, rng.uniform(-1000, 1000, size=n)
+
+
+def gerar_sistema_banda(n, kl=1, ku=1, semente=0):
+    # Banda como a de treliças em cadeia / splines; kl = ku = 1 é tridiagonal
+    rng = np.random.default_rng(semente)
+    A = np.zeros((n, n))
+    for d in range(-kl, ku + 1):
+        if d:
+            A += np.diag(rng.uniform(-1, 1, n - abs(d)), d)
+    A[np.diag_indices(n)] = np.sum(np.abs(A), axis=1) + 1
+    return A, rng.uniform(-1000, 1000, size=n)
+
+
+def gerar_larguras(n_pontos):
+    # Perfil de casco do topo até a quilha (exemplo do navio quando n_pontos = 8)
+    if n_pontos == 8:
+        return 0.4, np.array([3.00, 2.92, 2.75, 2.52, 2.30, 1.84, 0.92, 0.00])
+    profundidade = np.linspace(0, 1, n_pontos)
+    return 2.8 / (n_pontos - 1), 3.0 * np.sqrt(1 - profundidade ** 2)
+
+
+def gerar_serie_moore(n_pontos, semente=0):
+    if n_pontos == len(ANOS_MOORE):
+        return np.array(ANOS_MOORE, dtype=np.float64), np.array(TRANSISTORES_MOORE, dtype=np.float64)
+    rng = np.random.default_rng(semente)
+    x = np.sort(rng.uniform(1971, 2006, n_pontos))
+    N = 10 ** (0.1418 * (x - 1971) + np.log10(2300) + rng.normal(0, 0.15, n_pontos))
+    return x, N
+
+
+#kernels: nome -> (tamanhos, preparar(tamanho) -> argumentos, executar(*argumentos) -> iterações ou None)
+def _preparar_trelica(tamanho):
+    # Tamanho = número de barras: 7 é a treliça do exercício, os demais são treliças em cadeia
+    # com as forças já calculadas (o tempo medido é só o da renderização sem display, em PNG)
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)  # trelica.py é um script da raiz do repositório, fora do pacote
+    import trelica
+
+    if tamanho == 7:
+        coords, barras, nomes, cargas, apoios = trelica_exemplo()
+    else:
+        coords, barras, cargas, apoios = gerar_trelica_cadeia((tamanho + 1) // 4)
+        nomes = None
+    forcas, _, _ = forcas_trelica(coords, barras, cargas, apoios)
+    return trelica.desenhar_trelica, coords, barras, forcas, nomes, cargas, apoios
+
+
+def _executar_trelica(desenhar, coords, barras, forcas, nomes, cargas, apoios):
+    desenhar(coords, barras, forcas, nomes, cargas, apoios, arquivo=io.BytesIO(), formato="png")
+
+
+def _executar_gauss(A, B):
+    resolver_gauss_manual(A, B)
+    return len(B) - 1  # Passos de eliminação
+
+
+def _executar_gauss_refinado(A, B):
+    return resolver_gauss_refinado(A, B)["passos_refinamento"]
+
+
+def _executar_seidel(A, B):
+    _, _, iters, _ = gauss_seidel(A, B, tol=1e-8, max_iter=1000)
+    return iters
+
+
+def _executar_despacho(A, B):
+    resolver_sistema(A, B)
+
+
+def _executar_trapezios(h, y):
+    regra_trapezios(h, y)
+
+
+def _executar_simpson(h, y):
+    regra_simpson(h, y)
+
+
+def _executar_mmq(x, N):
+    calcular_mmq_detalhado(x, N)
+
+
+def _executar_prever(anos, alpha, beta):
+    prever(anos, alpha, beta)
+
+
+def _preparar_prever(tamanho):
+    _, _, _, alpha, beta, _, _ = calcular_mmq_detalhado()
+    return np.linspace(1970, 2025, tamanho), alpha, beta
+
+
+KERNELS = {
+    "gauss": ([3, 30, 100, 300], gerar_sistema, _executar_gauss),
+    "gauss_refinado": ([3, 30, 100, 300, 1000], gerar_sistema, _executar_gauss_refinado),
+    "gauss_seidel": ([10, 100, 300, 1000], gerar_sistema, _executar_seidel),
+    "despacho_tridiagonal": ([10, 100, 1000, 3000], gerar_sistema_banda, _executar_despacho),
+    "despacho_banda": ([10, 100, 1000, 3000], lambda n: gerar_sistema_banda(n, 2, 3), _executar_despacho),
+    "trapezios": ([8, 10 ** 3, 10 ** 5, 10 ** 6], gerar_larguras, _executar_trapezios),
+    "simpson": ([8, 10 ** 3, 10 ** 5 + 1, 10 ** 6 + 1], gerar_larguras, _executar_simpson),
+    "mmq": ([11, 10 ** 3, 10 ** 5, 10 ** 6], gerar_serie_moore, _executar_mmq),
+    "prever": ([100, 10 ** 3, 10 ** 5, 10 ** 6], _preparar_prever, _executar_prever),
+    "desenhar_trelica": ([7, 10 ** 3 - 1, 10 ** 4 - 1, 10 ** 5 - 1], _preparar_trelica, _executar_trelica),
+}
+
+
+#medição
+def medir(executar, argumentos):
+    iteracoes = executar(*argumentos)  # Aquecimento
+
+    tempos = []
+    while len(tempos) < REPETICOES_MIN or (len(tempos) < REPETICOES_MAX and sum(tempos) < TEMPO_MIN_S):
+        inicio = time.perf_counter()
+        executar(*argumentos)
+        tempos.append(time.perf_counter() - inicio)
+
+    # Pico de memória em execução separada: tracemalloc distorce o tempo
+    tracemalloc.start()
+    try:
+        executar(*argumentos)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "tempo_s": min(tempos),
+        "tempo_mediano_s": float(np.median(tempos)),
+        "repeticoes": len(tempos),
+        "memoria_pico_bytes": pico,
+        "iteracoes": iteracoes,
+    }
+
+
+def executar_benchmarks(kernels=None, max_tamanho=None, progresso=None):
+    resultados = []
+    for nome in kernels or KERNELS:
+        if nome not in KERNELS:
+            raise ValueError(f"Kernel desconhecido: {nome}. Opções: {', '.join(KERNELS)}")
+        tamanhos, preparar, executar = KERNELS[nome]
+
+        for tamanho in tamanhos:
+            if max_tamanho is not None and tamanho > max_tamanho and tamanho != tamanhos[0]:
+                continue
+            medida = medir(executar, preparar(tamanho))
+            resultado = {"kernel": nome, "tamanho": tamanho, **medida}
+            resultados.append(resultado)
+            if progresso is not None:
+                progresso(resultado)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "resultados": resultados,
+    }
+
+
+#linha de base
+def salvar_linha_base(execucao, caminho):
+    with open(caminho, "w", encoding="utf-8") as arq:
+        json.dump(execucao, arq, ensure_ascii=False, indent=2)
+
+
+def carregar_linha_base(caminho):
+    with open(caminho, encoding="utf-8") as arq:
+        return json.load(arq)
+
+
+def _tempo_comparavel(resultado):
+    # Mediana das repetições: o mínimo de uma execução isolada oscila demais entre execuções
+    # (um caso sem mudança de código chegou a sair ~2x "mais lento"). Linhas de base antigas,
+    # sem a mediana, caem no mínimo.
+    return resultado.get("tempo_mediano_s", resultado["tempo_s"])
+
+
+def comparar(execucao, base, limiar=LIMIAR_REGRESSAO):
+    # Marca cada caso (kernel, tamanho) presente nas duas execuções
+    anteriores = {(r["kernel"], r["tamanho"]): r for r in base["resultados"]}
+    comparacao = []
+    for atual in execucao["resultados"]:
+        anterior = anteriores.get((atual["kernel"], atual["tamanho"]))
+        if anterior is None:
+            continue
+
+        tempo_atual, tempo_anterior = _tempo_comparavel(atual), _tempo_comparavel(anterior)
+        memoria_atual, memoria_anterior = atual["memoria_pico_bytes"], anterior["memoria_pico_bytes"]
+        razao_tempo = tempo_atual / tempo_anterior if tempo_anterior > 0 else 1.0
+        razao_memoria = memoria_atual / memoria_anterior if memoria_anterior > 0 else 1.0
+        comparacao.append({
+            "kernel": atual["kernel"],
+            "tamanho": atual["tamanho"],
+            "razao_tempo": razao_tempo,
+            "razao_memoria": razao_memoria,
+            "regressao": ((razao_tempo > 1 + limiar and tempo_atual - tempo_anterior > RUIDO_TEMPO_S)
+                          or (razao_memoria > 1 + limiar and memoria_atual - memoria_anterior > RUIDO_MEMORIA_BYTES)),
+        })
+    return comparacao
+
+
+def imprimir_progresso(resultado):
+    print(f"{resultado['kernel']:>18} n={resultado['tamanho']:<8} {resultado['tempo_s'] * 1e3:10.3f} ms "
+          f"{resultado['memoria_pico_bytes'] / 1024:10.1f} KiB", file=sys.stderr)
@@ -0,0 +1,325 @@
+# Entradas de linha de comando para processamento em lote (sem interface gráfica).
+#
+#   python -m calculo_numerico gauss sistema.json
+#   python -m calculo_numerico seidel sistema.csv --tol 1e-6 --formato csv
+#   python -m calculo_numerico resolver sistema.json
+#   cat larguras.txt | python -m calculo_numerico integrar --h 0.4
+#   python -m calculo_numerico mmq series.csv --previsao 2030
+#   python -m calculo_numerico importacao --orcamento-ms 250
+#   python -m calculo_numerico benchmark --saida atual.json --comparar base.json
+#
+# A entrada vem de um arquivo ou da entrada padrão ("-" ou omitido), em JSON ou CSV
+# (detectado pelo primeiro caractere). A saída é JSON (padrão) ou CSV.
+import argparse
+import csv
+import io
+import json
+import math
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from calculo_numerico.sistemas import resolver_gauss_manual, resolver_gauss_refinado, gauss_seidel
+from calculo_numerico.despacho import resolver_sistema
+from calculo_numerico.quadratura import regra_trapezios, regra_simpson
+from calculo_numerico.regressao import ajustar_mmq_agrupado
+from calculo_numerico import benchmark
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULOS_NUCLEO = ["calculo_numerico", "calculo_numerico.sistemas", "calculo_numerico.despacho",
+                  "calculo_numerico.trelicas", "calculo_numerico.quadratura", "calculo_numerico.regressao"]
+ORCAMENTO_IMPORTACAO_MS = 250
+
+
+#leitura
+def _ler_entrada(caminho, id_textual=False):
+    if caminho in (None, "-"):
+        texto = sys.stdin.read()
+    else:
+        with open(caminho, encoding="utf-8") as arq:
+            texto = arq.read()
+
+    texto = texto.strip()
+    if not texto:
+        raise ValueError("Entrada vazia.")
+    if texto[0] in "{[":
+        return json.loads(texto)
+
+    # CSV: separador vírgula, ponto e vírgula ou espaço; linhas de cabeçalho não numéricas são ignoradas.
+    # Com id_textual, a primeira de 3 colunas (series_id) pode ser texto e fica como string.
+    linhas = []
+    for campos in csv.reader(io.StringIO(texto.replace(";", ","))):
+        campos = [c.strip() for c in campos if c.strip()]
+        if len(campos) == 1 and " " in campos[0]:
+            campos = campos[0].split()
+        if not campos:
+            continue
+        try:
+            if id_textual and len(campos) == 3:
+                linhas.append([_numero_ou_texto(campos[0])] + [float(c) for c in campos[1:]])
+            else:
+                linhas.append([float(c) for c in campos])
+        except ValueError:
+            if linhas:
+                raise
+    return linhas
+
+
+def _numero_ou_texto(campo):
+    try:
+        return float(campo)
+    except ValueError:
+        return campo
+
+
+def _ler_sistema(dados):
+    # JSON {"A": [[...]], "B": [...], "x0": [...]} ou CSV com a matriz aumentada [A | B]
+    if isinstance(dados, dict):
+        A = np.array(dados["A"], dtype=np.float64)
+        B = np.array(dados["B"], dtype=np.float64)
+        x0 = dados.get("x0")
+    else:
+        aumentada = np.array(dados, dtype=np.float64)
+        A, B, x0 = aumentada[:, :-1], aumentada[:, -1], None
+
+    if A.ndim != 2 or A.shape[0] != A.shape[1] or A.shape[0] != len(B):
+        raise ValueError(f"Sistema inválido: A {A.shape}, B {B.shape}.")
+    return A, B, x0
+
+
+#saída
+def _sem_nao_finitos(valor):
+    # NaN/inf não existem em JSON: viram null (e campo vazio no CSV)
+    if isinstance(valor, dict):
+        return {chave: _sem_nao_finitos(v) for chave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_sem_nao_finitos(v) for v in valor]
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    return valor
+
+
+def _emitir(resultado, tabela, formato, saida, colunas=None):
+    if formato == "json":
+        json.dump(_sem_nao_finitos(resultado), saida, ensure_ascii=False, indent=2, allow_nan=False)
+        saida.write("\n")
+        return
+
+    # Tabela vazia: só o cabeçalho, quando o comando informa as colunas
+    if colunas is None:
+        if not tabela:
+            return
+        colunas = list(tabela[0].keys())
+    escritor = csv.DictWriter(saida, fieldnames=colunas, lineterminator="\n")
+    escritor.writeheader()
+    escritor.writerows(_sem_nao_finitos(tabela))
+
+
+#comandos
+def _cmd_gauss(args):
+    A, B, _ = _ler_sistema(_ler_entrada(args.entrada))
+    if args.precisao_mista:
+        resultado = resolver_gauss_refinado(A, B, medir_speedup=True)
+        x = resultado["x"]
+        resultado["x"] = x.tolist()
+    else:
+        x = resolver_gauss_manual(A, B)
+        resultado = {"x": x.tolist(), "erro_residual": float(np.linalg.norm(np.dot(A, x) - B))}
+
+    tabela = [{"variavel": f"x{i + 1}", "valor": v} for i, v in enumerate(x.tolist())]
+    return resultado, tabela
+
+
+def _cmd_seidel(args):
+    A, B, x0 = _ler_sistema(_ler_entrada(args.entrada))
+    x, convergiu, iters, max_err = gauss_seidel(A, B, x0, args.tol, args.max_iter)
+
+    resultado = {"x": x.tolist(), "convergiu": convergiu, "iteracoes": iters, "erro": max_err}
+    tabela = [{"variavel": f"x{i + 1}", "valor": v} for i, v in enumerate(x.tolist())]
+    return resultado, tabela
+
+
+def _cmd_resolver(args):
+    A, B, _ = _ler_sistema(_ler_entrada(args.entrada))
+    resultado = resolver_sistema(A, B)
+    x = resultado["x"]
+    resultado["x"] = x.tolist()
+
+    tabela = [{"variavel": f"x{i + 1}", "valor": v, "metodo": resultado["metodo"]} for i, v in enumerate(x.tolist())]
+    return resultado, tabela
+
+
+def _cmd_integrar(args):
+    # JSON {"h": 0.4, "y": [...]} ou lista de larguras (CSV / uma por linha) com --h
+    dados = _ler_entrada(args.entrada)
+    if isinstance(dados, dict):
+        h = dados.get("h") if args.h is None else args.h
+        y = np.array(dados["y"], dtype=np.float64)
+    else:
+        h = args.h
+        y = np.array([v for linha in dados for v in linha], dtype=np.float64)
+    if h is None:
+        raise ValueError("Informe o passo h (--h ou campo \"h\" no JSON).")
+    h = float(h)
+
+    resultado = {
+        "h": h,
+        "n_intervalos": len(y) - 1,
+        "trapezios": float(regra_trapezios(h, y)),
+        "simpson": float(regra_simpson(h, y)),
+    }
+    return resultado, [resultado]
+
+
+def _cmd_mmq(args):
+    # JSON {"x": [...], "N": [...]} ou {"series_id": [...], "x": [...], "N": [...]};
+    # CSV com colunas (x, N) ou (series_id, x, N)
+    dados = _ler_entrada(args.entrada, id_textual=True)
+    if isinstance(dados, dict):
+        x = np.array(dados["x"], dtype=np.float64)
+        N = np.array(dados["N"], dtype=np.float64)
+        series_id = np.array(dados.get("series_id", np.zeros(len(x), dtype=int)))
+    else:
+        larguras = {len(linha) for linha in dados}
+        if len(larguras) != 1 or larguras.pop() not in (2, 3):
+            raise ValueError("O CSV precisa ter as colunas (x, N) ou (series_id, x, N).")
+        colunas = np.array([linha[-2:] for linha in dados], dtype=np.float64)
+        x, N = colunas[:, 0], colunas[:, 1]
+        if len(dados[0]) == 2:
+            series_id = np.zeros(len(colunas), dtype=int)
+        else:
+            ids = [linha[0] for linha in dados]
+            if all(isinstance(i, float) and i.is_integer() for i in ids):
+                series_id = np.array(ids, dtype=np.int64)
+            else:
+                # Ids textuais (ou misturados) ficam todos como texto
+                series_id = np.array([i if isinstance(i, str) else f"{i:g}" for i in ids])
+
+    ajuste = ajustar_mmq_agrupado(series_id, x, N)
+
+    tabela = []
+    for i, sid in enumerate(ajuste["series_id"].tolist()):
+        linha = {"series_id": sid}
+        for chave in ("n", "beta", "alpha", "B_linear", "r2", "desvio"):
+            linha[chave] = ajuste[chave][i].item()
+        if args.previsao is not None:
+            # Em log10 para não estourar: alpha = 10^B_linear pode ser ~1e-300 com x em anos.
+            # Se nem N previsto couber em float64, sai só o log10 (previsao vira null/vazio).
+            log_previsao = float(ajuste["B_linear"][i] + ajuste["beta"][i] * args.previsao)
+            linha["previsao_log10"] = log_previsao
+            with np.errstate(over='ignore'):
+                linha["previsao"] = float(np.power(10.0, log_previsao))
+        tabela.append(linha)
+
+    return {"series": tabela}, tabela
+
+
+def _cmd_importacao(args):
+    # Tempo de importação "a frio" de cada módulo do núcleo, em um interpretador novo
+    tabela = []
+    for modulo in MODULOS_NUCLEO:
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+                              capture_output=True, text=True, check=True, cwd=RAIZ)
+        # Linhas de -X importtime: "import time: self | cumulativo | módulo", com o nome recuado
+        # quando a importação é aninhada. Soma as de primeiro nível do pacote, que já incluem o que
+        # cada uma puxou (numpy, o __init__); as da inicialização do interpretador ficam de fora.
+        cumulativo_us = 0
+        for linha in proc.stderr.splitlines()[1:]:
+            _, cumulativo, nome = linha.split("|")
+            if nome.startswith(" calculo_numerico"):
+                cumulativo_us += int(cumulativo)
+        tabela.append({"modulo": modulo, "tempo_ms": cumulativo_us / 1000,
+                       "dentro_orcamento": cumulativo_us / 1000 <= args.orcamento_ms})
+
+    # Interfaces gráficas não podem ser puxadas pelo núcleo
+    verificacao = "import sys, calculo_numerico; print(','.join(m for m in ('tkinter', 'matplotlib') if m in sys.modules))"
+    proc = subprocess.run([sys.executable, "-c", verificacao], capture_output=True, text=True, check=True, cwd=RAIZ)
+    gui_importada = [m for m in proc.stdout.strip().split(",") if m]
+
+    ok = all(linha["dentro_orcamento"] for linha in tabela) and not gui_importada
+    resultado = {"orcamento_ms": args.orcamento_ms, "modulos": tabela, "gui_importada": gui_importada, "ok": ok}
+    return resultado, tabela
+
+
+def _cmd_benchmark(args):
+    execucao = benchmark.executar_benchmarks(args.kernels, args.max_tamanho, benchmark.imprimir_progresso)
+    if args.saida:
+        benchmark.salvar_linha_base(execucao, args.saida)
+
+    tabela = execucao["resultados"]
+    resultado = dict(execucao)
+    if args.comparar:
+        comparacao = benchmark.comparar(execucao, benchmark.carregar_linha_base(args.comparar), args.limiar)
+        if not comparacao:
+            print("Nenhum caso (kernel, tamanho) em comum com a linha de base para comparar.", file=sys.stderr)
+        regressoes = [c for c in comparacao if c["regressao"]]
+        for c in regressoes:
+            print(f"REGRESSÃO: {c['kernel']} n={c['tamanho']} tempo x{c['razao_tempo']:.2f} "
+                  f"memória x{c['razao_memoria']:.2f}", file=sys.stderr)
+        tabela = comparacao
+        colunas = benchmark.COLUNAS_COMPARACAO
+        resultado.update({"limiar": args.limiar, "comparacao": comparacao, "ok": not regressoes})
+    else:
+        colunas = benchmark.COLUNAS_RESULTADO
+    return resultado, tabela, colunas
+
+
+def criar_parser():
+    parser = argparse.ArgumentParser(prog="python -m calculo_numerico",
+                                     description="Processamento em lote dos métodos numéricos (sem interface gráfica).")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    def comando(nome, funcao, ajuda, com_entrada=True):
+        p = sub.add_parser(nome, help=ajuda)
+        if com_entrada:
+            p.add_argument("entrada", nargs="?", default="-", help="Arquivo JSON/CSV (padrão: entrada padrão)")
+        p.add_argument("--formato", choices=["json", "csv"], default="json")
+        p.set_defaults(funcao=funcao)
+        return p
+
+    p = comando("gauss", _cmd_gauss, "Eliminação de Gauss com pivoteamento parcial")
+    p.add_argument("--precisao-mista", action="store_true",
+                   help="Fatora em float32 e refina em float64 (volta para float64 se estagnar)")
+
+    p = comando("seidel", _cmd_seidel, "Método iterativo de Gauss-Seidel")
+    p.add_argument("--tol", type=float, default=1e-4)
+    p.add_argument("--max-iter", type=int, default=500)
+
+    comando("resolver", _cmd_resolver, "Escolhe o método pela estrutura da matriz (banda, tridiagonal, esparsa)")
+
+    p = comando("integrar", _cmd_integrar, "Regras dos Trapézios e de Simpson")
+    p.add_argument("--h", type=float, default=None, help="Passo entre os pontos")
+
+    p = comando("mmq", _cmd_mmq, "Ajuste exponencial N = alpha * 10^(beta * x) por série")
+    p.add_argument("--previsao", type=float, default=None, help="Valor de x para prever N")
+
+    p = comando("importacao", _cmd_importacao, "Mede o tempo de importação do núcleo", com_entrada=False)
+    p.add_argument("--orcamento-ms", type=float, default=ORCAMENTO_IMPORTACAO_MS)
+
+    p = comando("benchmark", _cmd_benchmark, "Mede tempo e memória dos núcleos em vários tamanhos",
+                com_entrada=False)
+    p.add_argument("--kernels", nargs="+", choices=list(benchmark.KERNELS), default=None)
+    p.add_argument("--max-tamanho", type=int, default=None, help="Ignora tamanhos maiores que este")
+    p.add_argument("--saida", default=None, help="Salva a execução como linha de base JSON")
+    p.add_argument("--comparar", default=None, help="Linha de base JSON de uma execução anterior")
+    p.add_argument("--limiar", type=float, default=benchmark.LIMIAR_REGRESSAO,
+                   help="Aumento relativo de tempo/memória considerado regressão (padrão: 0.25)")
+
+    return parser
+
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    try:
+        resultado, tabela, *colunas = args.funcao(args)
+    except KeyError as e:
+        print(f"Erro: campo ausente na entrada: {e}", file=sys.stderr)
+        return 2
+    except (ValueError, OSError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 2
+
+    _emitir(resultado, tabela, args.formato, sys.stdout, colunas[0] if colunas else None)
+    return 0 if resultado.get("ok", True) else 1
@@ -0,0 +1,137 @@
+# Escolha automática do método para A·x = B conforme a estrutura da matriz.
+#
+# A inspeção mede esparsidade, largura de banda e dominância diagonal. A parte que
+# depende só do padrão de não nulos (banda, densidade, simetria do padrão) fica em cache pela
+# estrutura da matriz, então sistemas repetidos com a mesma forma (mesma treliça, mesma spline)
+# não pagam a varredura de novo. Cada decisão guarda o método escolhido e o motivo.
+#
+# Sem `chave_estrutura`, a chave do cache é o hash do padrão A != 0, que ainda percorre as n²
+# posições: o cache poupa só a análise do padrão (np.nonzero, banda, simetria), não a varredura.
+# Quem já sabe a estrutura (uma treliça pelas suas barras, uma spline pelo número de nós) passa
+# uma chave própria e, no acerto, nem monta o padrão. A chave precisa mudar sempre que o padrão
+# de não nulos mudar; as propriedades que dependem dos valores são recalculadas de todo modo.
+import hashlib
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from calculo_numerico.sistemas import (fatorar_lu, resolver_lu, matriz_para_banda, fatorar_banda, resolver_banda,
+                                       resolver_thomas, gauss_seidel_esparso)
+
+TAMANHO_CACHE = 128
+DENSIDADE_ESPARSA = 0.05  # Abaixo disto a matriz é tratada como esparsa
+FRACAO_BANDA = 0.25  # Banda total (kl + ku + 1) até esta fração de n usa LU em banda
+
+_cache_estrutura = OrderedDict()
+historico_despacho = deque(maxlen=100)  # Últimas decisões: método, motivo e estrutura
+
+
+def _chave_estrutura(padrao):
+    # Forma + padrão de não nulos compactado em bits
+    resumo = hashlib.blake2b(np.packbits(padrao).tobytes(), digest_size=16).hexdigest()
+    return padrao.shape, resumo
+
+
+def _inspecionar_padrao(padrao):
+    n = padrao.shape[0]
+    linhas, colunas = np.nonzero(padrao)
+    deslocamento = colunas - linhas
+    kl = int(max(0, -deslocamento.min())) if len(linhas) else 0
+    ku = int(max(0, deslocamento.max())) if len(linhas) else 0
+    return {
+        "n": n,
+        "nao_nulos": len(linhas),
+        "densidade": len(linhas) / (n * n),
+        "kl": kl,
+        "ku": ku,
+        "padrao_simetrico": bool(np.array_equal(padrao, padrao.T)),
+        # Tridiagonal sem zeros nas diagonais vizinhas: irredutível
+        "tridiagonal_irredutivel": bool(kl == 1 and ku == 1 and np.all(np.diagonal(padrao, -1))
+                                        and np.all(np.diagonal(padrao, 1))),
+    }
+
+
+def inspecionar_matriz(A_in, chave_estrutura=None):
+    A = np.asarray(A_in, dtype=np.float64)
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError(f"A matriz precisa ser quadrada: {A.shape}.")
+
+    padrao = None
+    if chave_estrutura is None:
+        padrao = A != 0
+        chave = _chave_estrutura(padrao)
+    else:
+        chave = A.shape, ("chamador", chave_estrutura)
+    em_cache = chave in _cache_estrutura
+    if em_cache:
+        _cache_estrutura.move_to_end(chave)
+        estrutura = _cache_estrutura[chave]
+    else:
+        estrutura = _inspecionar_padrao(A != 0 if padrao is None else padrao)
+        _cache_estrutura[chave] = estrutura
+        if len(_cache_estrutura) > TAMANHO_CACHE:
+            _cache_estrutura.popitem(last=False)
+
+    # Propriedades que dependem dos valores são recalculadas (custam uma passada em A)
+    diagonal = np.abs(np.diag(A))
+    fora = np.sum(np.abs(A), axis=1) - diagonal
+    info = dict(estrutura)
+    info.update({
+        "diagonal_dominante": bool(np.all(diagonal >= fora) and np.any(diagonal > fora)),
+        "diagonal_estrita": bool(np.all(diagonal > fora)),
+        "em_cache": em_cache,
+    })
+    return info
+
+
+def escolher_metodo(info):
+    n, kl, ku = info["n"], info["kl"], info["ku"]
+
+    # Só dominância estrita, ou fraca com a matriz irredutível, garante pivôs não nulos no Thomas;
+    # com dominância fraca e um zero nas diagonais vizinhas o sistema pode ser singular
+    if n > 2 and kl == 1 and ku == 1 and (info["diagonal_estrita"] or
+                                          (info["diagonal_dominante"] and info["tridiagonal_irredutivel"])):
+        return "thomas", "tridiagonal e diagonal dominante: Thomas em O(n) é estável sem pivoteamento"
+    if kl + ku + 1 <= FRACAO_BANDA * n:
+        return "lu_banda", (f"banda kl={kl}, ku={ku} estreita para n={n}: "
+                            f"LU com pivoteamento em O(n·bw²) no armazenamento compacto")
+    if info["densidade"] < DENSIDADE_ESPARSA and info["diagonal_estrita"]:
+        return "gauss_seidel_esparso", (f"densidade {info['densidade']:.2%} e diagonal estritamente dominante: "
+                                        f"Gauss-Seidel converge e cada varredura custa O(não nulos)")
+    return "lu_denso", "sem estrutura aproveitável: LU denso com pivoteamento parcial"
+
+
+def resolver_sistema(A_in, B_in, tol=1e-10, max_iter=1000, chave_estrutura=None):
+    A = np.asarray(A_in, dtype=np.float64)
+    B = np.asarray(B_in, dtype=np.float64)
+    if A.shape[0] != len(B):
+        raise ValueError(f"Sistema inválido: A {A.shape}, B {B.shape}.")
+
+    info = inspecionar_matriz(A, chave_estrutura)
+    metodo, motivo = escolher_metodo(info)
+    iteracoes = None
+
+    if metodo == "thomas":
+        x = resolver_thomas(np.diagonal(A, -1), np.diagonal(A), np.diagonal(A, 1), B)
+    elif metodo == "lu_banda":
+        kl, ku = info["kl"], info["ku"]
+        x = resolver_banda(fatorar_banda(matriz_para_banda(A, kl, ku), kl, ku), B)
+    elif metodo == "gauss_seidel_esparso":
+        x, convergiu, iteracoes, _ = gauss_seidel_esparso(A, B, tol=tol, max_iter=max_iter)
+        if not convergiu:
+            # Não deveria acontecer com dominância estrita, mas a resposta não pode sair errada
+            motivo += f"; não convergiu em {max_iter} iterações, refeito com LU denso"
+            metodo = "lu_denso"
+            x = resolver_lu(*fatorar_lu(A), B)
+    elif metodo == "lu_denso":
+        x = resolver_lu(*fatorar_lu(A), B)
+
+    decisao = {"metodo": metodo, "motivo": motivo, "estrutura": info}
+    historico_despacho.append(decisao)
+
+    return {
+        "x": x,
+        **decisao,
+        "iteracoes": iteracoes,
+        "erro_residual": float(np.linalg.norm(np.dot(A, x) - B)),
+    }
@@ -0,0 +1,33 @@
+# Integração numérica por tabela de pontos igualmente espaçados (passo h).
+import numpy as np
+
+
+def regra_trapezios(h, y):
+    # Formula: h/2 * (y_inicial + 2*soma_meio + y_final)
+    y = np.asarray(y, dtype=np.float64)
+    if len(y) < 2:
+        raise ValueError("É necessário pelo menos 2 pontos (1 intervalo).")
+    return (h / 2) * (y[0] + 2 * np.sum(y[1:-1]) + y[-1])
+
+
+def _simpson_puro(h, y):
+    # Formula: h/3 * (y0 + 4*Impares + 2*Pares + yn)
+    soma_impares = np.sum(y[1:-1:2])  # Índices 1, 3, 5...
+    soma_pares = np.sum(y[2:-1:2])  # Índices 2, 4, 6...
+    return (h / 3) * (y[0] + 4 * soma_impares + 2 * soma_pares + y[-1])
+
+
+def regra_simpson(h, y):
+    # Simpson 1/3 com número par de intervalos; com número ímpar aplica
+    # Simpson até o penúltimo ponto + Trapézio no último intervalo (método misto)
+    y = np.asarray(y, dtype=np.float64)
+    n_intervalos = len(y) - 1
+    if n_intervalos < 1:
+        raise ValueError("É necessário pelo menos 2 pontos (1 intervalo).")
+
+    if n_intervalos % 2 == 0:
+        return _simpson_puro(h, y)
+
+    area_parte_simp = _simpson_puro(h, y[:-1]) if n_intervalos > 1 else 0.0
+    area_parte_trap = (h / 2) * (y[-2] + y[-1])
+    return area_parte_simp + area_parte_trap
@@ -0,0 +1,294 @@
+# Regressão exponencial pelo Método dos Mínimos Quadrados (Lei de Moore).
+import os
+import numpy as np
+
+
+# Dados OTIMIZADOS da Lei de Moore
+ANOS_MOORE = [1971, 1974, 1978, 1982, 1985, 1989, 1993, 1997, 2000, 2003, 2006]
+TRANSISTORES_MOORE = [2300, 5000, 29000, 120000, 275000, 1200000, 3100000, 7500000, 42000000, 100000000, 200000000]
+
+
+def calcular_mmq_detalhado(x_ano=None, N=None):
+    # 1. Dados (por padrão, a série clássica da Lei de Moore)
+    x_ano = np.array(ANOS_MOORE if x_ano is None else x_ano, dtype=np.float64)
+    N = np.array(TRANSISTORES_MOORE if N is None else N, dtype=np.float64)
+    n_pontos = len(x_ano)
+
+    # 2. Linearização e Centralização
+    y_log = np.log10(N)
+
+    x_medio = np.mean(x_ano)
+    t = x_ano - x_medio
+
+    # 3. Cálculo dos Somatórios
+    sum_t = np.sum(t)
+    sum_t2 = np.sum(t ** 2)
+    sum_y = np.sum(y_log)
+    sum_ty = np.sum(t * y_log)
+
+    # 4. Solução do Sistema Simplificado
+    A_angular = sum_ty / sum_t2
+    B_t_linear = sum_y / n_pontos
+
+    # 5. Parâmetros MMQ:
+    beta = A_angular
+    B_linear = B_t_linear - (A_angular * x_medio)
+    alpha = 10 ** B_linear
+
+    # Retorna string de memória de cálculo
+    detalhes_calculo = (
+        f"PASSO 1: CENTRALIZAÇÃO DE TEMPO (Novos Dados)\n"
+        f"--------------------------------------------\n"
+        f"Média dos Anos (x_medio) = {x_medio:.6f}\n"
+        f"Nova variável: t = Ano - {x_medio:.6f}\n\n"
+        f"PASSO 2: TABELA DE SOMATÓRIOS (n={n_pontos})\n"
+        f"--------------------------------------------\n"
+        f"Σ t    = {sum_t:.6f} (~0)\n"
+        f"Σ t²   = {sum_t2:,.4f}\n"
+        f"Σ y    = {sum_y:.6f}  (onde y = log10(N))\n"
+        f"Σ t·y  = {sum_ty:,.6f}\n\n"
+        f"PASSO 3: SOLUÇÃO DO SISTEMA SIMPLIFICADO\n"
+        f"--------------------------------------------\n"
+        f"A (Angular/Inclinação) = Σ t·y / Σ t² = {A_angular:.6f}\n"
+        f"B_t (Intercepto em t=0) = Σ y / n = {B_t_linear:.6f}\n\n"
+        f"PASSO 4: MODELO FINAL\n"
+        f"--------------------------------------------\n"
+        f"Intercepto original (B) = B_t - A * x_medio = {B_linear:.6f}\n"
+        f"alpha = 10^B = {alpha:.4e}\n"
+        f"Equação: N = {alpha:.4e} * 10^({A_angular:.5f} * Ano)"
+    )
+
+    return x_ano, N, y_log, alpha, beta, B_linear, detalhes_calculo
+
+
+def prever(ano, alpha, beta):
+    return alpha * (10 ** (beta * ano))
+
+
+#incerteza (bootstrap / monte carlo)
+TAMANHO_BLOCO = 50000  # Reamostras por bloco (limita a memória da matriz de índices)
+LIMIAR_PARALELO = 1000000  # A partir daqui os blocos vão para um pool de processos
+
+
+def _ajustar_lote(x_b, y_b):
+    # Mesmo procedimento de calcular_mmq_detalhado, mas com uma reamostra por linha:
+    # centralização e somatórios viram reduções ao longo do eixo 1.
+    n_pontos = x_b.shape[1]
+    x_medio = np.mean(x_b, axis=1)
+    t = x_b - x_medio[:, None]
+
+    sum_t2 = np.einsum('ij,ij->i', t, t)
+    sum_ty = np.einsum('ij,ij->i', t, y_b)
+    sum_y = np.sum(y_b, axis=1)
+
+    # Reamostras com todos os anos iguais não definem uma reta
+    validas = sum_t2 > 0
+    beta = sum_ty[validas] / sum_t2[validas]
+    B_linear = sum_y[validas] / n_pontos - beta * x_medio[validas]
+    return beta, B_linear
+
+
+def _bootstrap_bloco(x_ano, y_log, n_reamostras, semente, metodo):
+    rng = np.random.default_rng(semente)
+    n_pontos = len(x_ano)
+
+    if metodo == "pares":
+        # Matriz de índices (n_reamostras x n_pontos) sorteada de uma vez só
+        idx = rng.integers(0, n_pontos, size=(n_reamostras, n_pontos))
+        beta, B_linear = _ajustar_lote(x_ano[idx], y_log[idx])
+
+        # Reamostras descartadas (todos os anos iguais) são sorteadas de novo, para os percentis
+        # saírem sempre de n_reamostras ajustes; x não constante garante que o laço termina
+        while len(beta) < n_reamostras:
+            idx = rng.integers(0, n_pontos, size=(n_reamostras - len(beta), n_pontos))
+            beta_extra, B_extra = _ajustar_lote(x_ano[idx], y_log[idx])
+            beta = np.concatenate([beta, beta_extra])
+            B_linear = np.concatenate([B_linear, B_extra])
+        return beta, B_linear
+
+    # Monte Carlo: mantém os anos e perturba log10(N) com o desvio dos resíduos
+    beta, B_linear = _ajustar_lote(x_ano[None, :], y_log[None, :])
+    y_ajustado = beta[0] * x_ano + B_linear[0]
+    residuos = y_log - y_ajustado
+    desvio = np.sqrt(np.sum(residuos ** 2) / (n_pontos - 2))
+    y_b = y_ajustado + rng.normal(0.0, desvio, size=(n_reamostras, n_pontos))
+    x_b = np.broadcast_to(x_ano, y_b.shape)
+    return _ajustar_lote(x_b, y_b)
+
+
+def bootstrap_mmq(x_ano, y_log, n_reamostras=2000, semente=42, metodo="pares", n_processos=None):
+    if metodo not in ("pares", "monte_carlo"):
+        raise ValueError(f"Método de reamostragem desconhecido: {metodo}")
+    if n_reamostras < 1:
+        raise ValueError("É necessário pelo menos 1 reamostra.")
+
+    x_ano = np.asarray(x_ano, dtype=np.float64)
+    y_log = np.asarray(y_log, dtype=np.float64)
+    if len(x_ano) < 3:
+        raise ValueError("São necessários pelo menos 3 pontos (o desvio dos resíduos usa n - 2).")
+    if np.ptp(x_ano) == 0:
+        raise ValueError("Todos os valores de x são iguais: a reta não pode ser ajustada.")
+
+    # Divide em blocos de tamanho fixo, cada um com sua própria semente derivada.
+    # O resultado depende só de (semente, n_reamostras), não do número de processos.
+    tamanhos = [TAMANHO_BLOCO] * (n_reamostras // TAMANHO_BLOCO)
+    if n_reamostras % TAMANHO_BLOCO:
+        tamanhos.append(n_reamostras % TAMANHO_BLOCO)
+    sementes = np.random.SeedSequence(semente).spawn(len(tamanhos))
+
+    if n_processos is None:
+        n_processos = os.cpu_count() or 1
+    n_processos = min(n_processos, len(tamanhos))
+
+    if n_reamostras >= LIMIAR_PARALELO and n_processos > 1:
+        # Importado só aqui: concurrent.futures pesa no tempo de importação do núcleo
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=n_processos) as pool:
+            resultados = list(pool.map(_bootstrap_bloco,
+                                       [x_ano] * len(tamanhos), [y_log] * len(tamanhos),
+                                       tamanhos, sementes, [metodo] * len(tamanhos)))
+    else:
+        resultados = [_bootstrap_bloco(x_ano, y_log, tam, sem, metodo)
+                      for tam, sem in zip(tamanhos, sementes)]
+
+    beta = np.concatenate([r[0] for r in resultados])
+    B_linear = np.concatenate([r[1] for r in resultados])
+    return beta, B_linear
+
+
+def intervalos_confianca(beta_b, B_linear_b, x_prev, nivel=0.95):
+    cauda = (1 - nivel) / 2 * 100
+    percentis = [cauda, 100 - cauda]
+
+    beta_ic = np.percentile(beta_b, percentis)
+    # Tempo de duplicação: N dobra quando beta * dt = log10(2)
+    duplicacao_ic = np.sort(np.log10(2) / beta_ic)
+
+    # Uma linha por reamostra, uma coluna por ano previsto
+    x_prev = np.atleast_1d(np.asarray(x_prev, dtype=np.float64))
+    log_prev = np.outer(beta_b, x_prev) + B_linear_b[:, None]
+    faixa_log = np.percentile(log_prev, percentis, axis=0)
+
+    return {
+        "nivel": nivel,
+        "beta": beta_ic,
+        "duplicacao": duplicacao_ic,
+        "x": x_prev,
+        "log_inf": faixa_log[0],
+        "log_sup": faixa_log[1],
+        "N_inf": 10 ** faixa_log[0],
+        "N_sup": 10 ** faixa_log[1],
+    }
+
+#várias séries ao mesmo tempo
+def _empilhar_series(series):
+    # Lista de vetores de tamanhos diferentes -> matriz preenchida + máscara
+    tamanhos = np.array([len(v) for v in series])
+    mascara = np.arange(tamanhos.max(initial=0))[None, :] < tamanhos[:, None]
+    matriz = np.zeros(mascara.shape, dtype=np.float64)
+    if mascara.size:
+        matriz[mascara] = np.concatenate([np.asarray(v, dtype=np.float64) for v in series])
+    return matriz, mascara
+
+
+def _estatisticas_mmq(n_pontos, sum_t2, sum_ty, sum_yy, y_medio, x_medio):
+    # Parte comum aos formatos matricial e agrupado, com os somatórios já centralizados
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beta = np.where(sum_t2 > 0, sum_ty / sum_t2, np.nan)
+        B_linear = y_medio - beta * x_medio
+
+        # Resíduo sem segunda passada: Σ(y - ŷ)² = Σ(y - ȳ)² - beta·Σ t·y
+        sse = np.maximum(sum_yy - beta * sum_ty, 0.0)
+        r2 = np.where(sum_yy > 0, 1 - sse / sum_yy, np.nan)
+        desvio = np.where(n_pontos > 2, np.sqrt(sse / (n_pontos - 2)), np.nan)
+
+    return {
+        "n": n_pontos,
+        "x_medio": x_medio,
+        "beta": beta,
+        "B_linear": B_linear,
+        "alpha": 10 ** B_linear,
+        "sse": sse,
+        "r2": r2,
+        "desvio": desvio,
+    }
+
+
+def ajustar_mmq_multiplas(x, N, mascara=None):
+    # x, N: matrizes (n_series x n_max) ou listas de vetores de tamanhos diferentes
+    if not isinstance(x, np.ndarray) and len(x) and np.ndim(x[0]) == 1 and mascara is None:
+        x, mascara_x = _empilhar_series(x)
+        N, mascara_N = _empilhar_series(N)
+        if mascara_x.shape != mascara_N.shape or np.any(mascara_x != mascara_N):
+            raise ValueError("Cada série precisa ter o mesmo número de valores em x e N.")
+        mascara = mascara_x
+
+    x = np.asarray(x, dtype=np.float64)
+    N = np.asarray(N, dtype=np.float64)
+    if x.ndim <= 1 and x.size == 0 and N.size == 0:
+        # Nenhuma série (atleast_2d transformaria [] em uma série vazia, com tudo NaN)
+        x, N = x.reshape(0, 0), N.reshape(0, 0)
+    x = np.atleast_2d(x)
+    N = np.atleast_2d(N)
+    if x.shape != N.shape:
+        raise ValueError(f"x e N com formatos diferentes: {x.shape} e {N.shape}.")
+
+    # Valores ausentes (NaN) ficam sempre fora, com ou sem máscara explícita
+    presentes = ~(np.isnan(x) | np.isnan(N))
+    if mascara is None:
+        mascara = presentes
+    else:
+        mascara = np.broadcast_to(np.asarray(mascara, dtype=bool), x.shape) & presentes
+
+    if np.any(N[mascara] <= 0):
+        raise ValueError("Os valores de N precisam ser positivos para a linearização log10.")
+
+    # Linearização; posições fora da máscara viram 0 e não entram nas somas
+    y_log = np.log10(np.where(mascara, N, 1.0))
+    x = np.where(mascara, x, 0.0)
+    y_log = np.where(mascara, y_log, 0.0)
+
+    n_pontos = np.sum(mascara, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_medio = np.sum(x, axis=1) / n_pontos
+        y_medio = np.sum(y_log, axis=1) / n_pontos
+
+    t = np.where(mascara, x - x_medio[:, None], 0.0)
+    u = np.where(mascara, y_log - y_medio[:, None], 0.0)
+
+    sum_t2 = np.einsum('ij,ij->i', t, t)
+    sum_ty = np.einsum('ij,ij->i', t, u)
+    sum_yy = np.einsum('ij,ij->i', u, u)
+
+    return _estatisticas_mmq(n_pontos, sum_t2, sum_ty, sum_yy, y_medio, x_medio)
+
+
+def ajustar_mmq_agrupado(series_id, x, N):
+    # Formato longo: uma linha por ponto (series_id, x, N), em qualquer ordem
+    series_id = np.asarray(series_id)
+    x = np.asarray(x, dtype=np.float64)
+    N = np.asarray(N, dtype=np.float64)
+    if not (series_id.shape == x.shape == N.shape) or x.ndim != 1:
+        raise ValueError("series_id, x e N precisam ser vetores do mesmo tamanho.")
+    if np.any(N <= 0):
+        raise ValueError("Os valores de N precisam ser positivos para a linearização log10.")
+
+    ids, grupo = np.unique(series_id, return_inverse=True)
+    y_log = np.log10(N)
+
+    # Somatórios por série com bincount (uma redução por grandeza, sem laço por série)
+    n_pontos = np.bincount(grupo, minlength=len(ids))
+    x_medio = np.bincount(grupo, x, len(ids)) / n_pontos
+    y_medio = np.bincount(grupo, y_log, len(ids)) / n_pontos
+
+    t = x - x_medio[grupo]
+    u = y_log - y_medio[grupo]
+
+    sum_t2 = np.bincount(grupo, t * t, len(ids))
+    sum_ty = np.bincount(grupo, t * u, len(ids))
+    sum_yy = np.bincount(grupo, u * u, len(ids))
+
+    resultado = _estatisticas_mmq(n_pontos, sum_t2, sum_ty, sum_yy, y_medio, x_medio)
+    resultado["series_id"] = ids
+    return resultado
@@ -0,0 +1,354 @@
+# Solvers de sistemas lineares: eliminação de Gauss, LU em precisão mista, Gauss-Seidel
+# (denso e esparso) e os métodos para matrizes em banda e tridiagonais.
+import time
+
+import numpy as np
+
+
+def resolver_gauss_manual(A_in, B_in):
+    A = np.copy(A_in)
+    b = np.copy(B_in)
+    n = len(b)
+
+    for k in range(n - 1):
+        indice_max = k
+        valor_max = abs(A[k, k])
+
+        for i in range(k + 1, n):
+            if abs(A[i, k]) > valor_max:
+                valor_max = abs(A[i, k])
+                indice_max = i
+
+        if valor_max == 0:
+            raise ValueError("O sistema não tem solução única (Matriz Singular).")
+
+        if indice_max != k:
+            A[[k, indice_max]] = A[[indice_max, k]]
+            b[[k, indice_max]] = b[[indice_max, k]]
+
+        for i in range(k + 1, n):
+            fator = A[i, k] / A[k, k]
+
+            A[i, k:] = A[i, k:] - fator * A[k, k:]
+
+            b[i] = b[i] - fator * b[k]
+
+    if A[n - 1, n - 1] == 0:
+        raise ValueError("O sistema não tem solução única (Matriz Singular).")
+
+    x = np.zeros(n)
+
+    for i in range(n - 1, -1, -1):
+        soma_conhecidos = 0
+        for j in range(i + 1, n):
+            soma_conhecidos += A[i, j] * x[j]
+
+        x[i] = (b[i] - soma_conhecidos) / A[i, i]
+
+    return x
+
+
+def gauss_seidel(A_in, B_in, x0=None, tol=1e-4, max_iter=500):
+    A = np.asarray(A_in, dtype=np.float64)
+    b = np.asarray(B_in, dtype=np.float64)
+    n = len(b)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=np.float64)
+
+    diagonal = np.diag(A)
+    for i in range(n):
+        if abs(diagonal[i]) < 1e-9:
+            raise ValueError(f"Divisão por zero na linha {i + 1}")
+
+    converged = False
+    iters = max_iter
+    max_err = 0.0
+
+    for k in range(max_iter):
+        x_old = x.copy()
+        max_err = 0.0
+
+        for i in range(n):
+            # Soma dos termos fora da diagonal, já usando os valores novos de x
+            sigma = np.dot(A[i], x) - diagonal[i] * x[i]
+            x[i] = (b[i] - sigma) / diagonal[i]
+
+            if abs(x[i]) > 1e-9:
+                err = abs((x[i] - x_old[i]) / x[i])
+            else:
+                err = abs(x[i] - x_old[i])
+
+            if err > max_err: max_err = err
+
+        if max_err < tol:
+            converged = True
+            iters = k + 1
+            break
+
+    return x, converged, iters, max_err
+
+
+#precisão mista
+def fatorar_lu(A_in, dtype=np.float64):
+    # Mesma eliminação com pivoteamento parcial de resolver_gauss_manual, mas guardando
+    # os fatores (L abaixo da diagonal, U no resto) para resolver vários lados direitos.
+    LU = np.array(A_in, dtype=dtype)
+    n = LU.shape[0]
+    perm = np.arange(n)
+
+    for k in range(n - 1):
+        indice_max = k + np.argmax(np.abs(LU[k:, k]))
+        if LU[indice_max, k] == 0:
+            raise ValueError("O sistema não tem solução única (Matriz Singular).")
+
+        if indice_max != k:
+            LU[[k, indice_max]] = LU[[indice_max, k]]
+            perm[[k, indice_max]] = perm[[indice_max, k]]
+
+        # Todas as linhas abaixo do pivô de uma vez (atualização de posto 1)
+        fatores = LU[k + 1:, k] / LU[k, k]
+        LU[k + 1:, k + 1:] -= np.outer(fatores, LU[k, k + 1:])
+        LU[k + 1:, k] = fatores
+
+    if LU[n - 1, n - 1] == 0:
+        raise ValueError("O sistema não tem solução única (Matriz Singular).")
+
+    return LU, perm
+
+
+def resolver_lu(LU, perm, b_in):
+    n = len(perm)
+    y = np.asarray(b_in, dtype=LU.dtype)[perm]
+
+    # Substituição progressiva (L com diagonal unitária)
+    for i in range(1, n):
+        y[i] -= np.dot(LU[i, :i], y[:i])
+
+    # Substituição regressiva
+    x = np.zeros(n, dtype=LU.dtype)
+    for i in range(n - 1, -1, -1):
+        x[i] = (y[i] - np.dot(LU[i, i + 1:], x[i + 1:])) / LU[i, i]
+
+    return x
+
+
+def resolver_gauss_refinado(A_in, B_in, tol=None, max_refinos=10, medir_speedup=False):
+    # Fatora em float32 (metade do tráfego de memória) e recupera a precisão de float64
+    # com refinamento iterativo: r = B - A·x em float64, correção com os fatores float32.
+    A = np.asarray(A_in, dtype=np.float64)
+    B = np.asarray(B_in, dtype=np.float64)
+    if tol is None:
+        tol = np.finfo(np.float64).eps
+
+    inicio = time.perf_counter()
+    passos = 0
+    fallback = False
+    # Todo o estágio em float32 (casts de A, de B e dos resíduos, eliminação e substituições) pode
+    # estourar: o estouro é esperado, vira inf/NaN e os testes de finitude mandam para float64
+    with np.errstate(over='ignore', invalid='ignore'):
+        try:
+            LU, perm = fatorar_lu(A, np.float32)
+            if not np.all(np.isfinite(LU)):
+                raise ValueError("Fatoração em float32 estourou.")
+            x = resolver_lu(LU, perm, B).astype(np.float64)
+        except ValueError:
+            # Pivô nulo ou overflow em float32: vai direto para float64
+            fallback = True
+
+        if not fallback:
+            erro_anterior = np.inf
+            norma_A = np.linalg.norm(A)
+            norma_B = np.linalg.norm(B)
+            while True:
+                # Mesmo teste de resíduo da interface das Minas, relativo a ||A||·||x|| + ||B||
+                b_calc = np.dot(A, x)
+                erro = np.linalg.norm(b_calc - B)
+                if erro <= tol * (norma_A * np.linalg.norm(x) + norma_B):
+                    break
+                if passos >= max_refinos or not np.isfinite(erro) or erro > 0.5 * erro_anterior:
+                    # Estagnou (matriz mal condicionada para float32): refaz tudo em float64
+                    fallback = True
+                    break
+
+                correcao = resolver_lu(LU, perm, (B - b_calc).astype(np.float32))
+                x = x + correcao.astype(np.float64)
+                erro_anterior = erro
+                passos += 1
+
+    if fallback:
+        LU64, perm64 = fatorar_lu(A, np.float64)
+        x = resolver_lu(LU64, perm64, B)
+    tempo = time.perf_counter() - inicio
+
+    speedup = None
+    if medir_speedup:
+        inicio = time.perf_counter()
+        LU64, perm64 = fatorar_lu(A, np.float64)
+        resolver_lu(LU64, perm64, B)
+        speedup = (time.perf_counter() - inicio) / tempo
+
+    return {
+        "x": x,
+        "passos_refinamento": passos,
+        "fallback_float64": fallback,
+        "erro_residual": float(np.linalg.norm(np.dot(A, x) - B)),
+        "tempo_s": tempo,
+        "speedup": speedup,
+    }
+
+
+#sistemas com estrutura (banda, tridiagonal, esparso)
+def matriz_para_banda(A_in, kl, ku):
+    # Armazenamento compacto por diagonais (como o LAPACK): banda[ku + i - j, j] = A[i, j]
+    A = np.asarray(A_in, dtype=np.float64)
+    n = A.shape[0]
+    banda = np.zeros((kl + ku + 1, n))
+    # Diagonais além da n - 1 não existem: ficam como linhas zeradas da banda
+    for d in range(-min(kl, n - 1), min(ku, n - 1) + 1):
+        diag = np.diagonal(A, d)
+        if d >= 0:
+            banda[ku - d, d:] = diag
+        else:
+            banda[ku - d, :n + d] = diag
+    return banda
+
+
+def fatorar_banda(banda_in, kl, ku):
+    # LU com pivoteamento parcial em O(n·kl·(kl+ku)). As kl linhas extras no topo
+    # recebem o preenchimento que as trocas de linha criam acima da banda original.
+    n = banda_in.shape[1]
+    ab = np.zeros((2 * kl + ku + 1, n))
+    ab[kl:] = banda_in
+    d = kl + ku  # Linha de ab onde fica a diagonal principal
+    piv = np.arange(n)
+
+    # Posição em ab de A[k + di, k + dj], relativa ao passo k
+    di = np.arange(1, kl + 1)
+    dj = np.arange(1, kl + ku + 1)
+    linhas_rel = d + di[:, None] - dj[None, :]
+
+    for k in range(n):
+        m = min(kl, n - 1 - k)  # Elementos abaixo do pivô
+        u = min(kl + ku, n - 1 - k)  # Elementos à direita do pivô (com preenchimento)
+
+        p = np.argmax(np.abs(ab[d:d + m + 1, k]))
+        if ab[d + p, k] == 0:
+            raise ValueError("O sistema não tem solução única (Matriz Singular).")
+        piv[k] = k + p
+
+        if p:
+            j = np.arange(k, k + u + 1)
+            linha_k = ab[d + k - j, j]
+            ab[d + k - j, j] = ab[d + k + p - j, j]
+            ab[d + k + p - j, j] = linha_k
+
+        if m:
+            ab[d + 1:d + m + 1, k] /= ab[d, k]
+            if u:
+                colunas = k + dj[:u]
+                ab[linhas_rel[:m, :u], colunas] -= np.outer(ab[d + 1:d + m + 1, k], ab[d - dj[:u], colunas])
+
+    return ab, piv, kl, ku
+
+
+def resolver_banda(fatores, b_in):
+    ab, piv, kl, ku = fatores
+    n = ab.shape[1]
+    d = kl + ku
+    y = np.array(b_in, dtype=np.float64)
+
+    # Aplica as trocas e L (diagonal unitária)
+    for k in range(n):
+        if piv[k] != k:
+            y[k], y[piv[k]] = y[piv[k]], y[k]
+        m = min(kl, n - 1 - k)
+        if m:
+            y[k + 1:k + m + 1] -= ab[d + 1:d + m + 1, k] * y[k]
+
+    # Substituição regressiva em U, que tem largura kl + ku acima da diagonal
+    x = np.zeros(n)
+    for i in range(n - 1, -1, -1):
+        u = min(kl + ku, n - 1 - i)
+        j = np.arange(i + 1, i + u + 1)
+        x[i] = (y[i] - np.dot(ab[d + i - j, j], x[j])) / ab[d, i]
+
+    return x
+
+
+def resolver_thomas(inferior, diagonal, superior, d_in):
+    # Algoritmo de Thomas para sistemas tridiagonais: inferior[i] = A[i+1, i],
+    # superior[i] = A[i, i+1]. Sem pivoteamento: use com diagonal dominante.
+    a = np.asarray(inferior, dtype=np.float64).tolist()
+    b = np.asarray(diagonal, dtype=np.float64).tolist()
+    c = np.asarray(superior, dtype=np.float64).tolist()
+    d = np.asarray(d_in, dtype=np.float64).tolist()
+    n = len(b)
+
+    c_linha = [0.0] * n
+    d_linha = [0.0] * n
+    if b[0] == 0:
+        raise ValueError("Pivô nulo no algoritmo de Thomas.")
+    c_linha[0] = c[0] / b[0] if n > 1 else 0.0
+    d_linha[0] = d[0] / b[0]
+
+    for i in range(1, n):
+        denominador = b[i] - a[i - 1] * c_linha[i - 1]
+        if denominador == 0:
+            raise ValueError("Pivô nulo no algoritmo de Thomas.")
+        if i < n - 1:
+            c_linha[i] = c[i] / denominador
+        d_linha[i] = (d[i] - a[i - 1] * d_linha[i - 1]) / denominador
+
+    x = [0.0] * n
+    x[n - 1] = d_linha[n - 1]
+    for i in range(n - 2, -1, -1):
+        x[i] = d_linha[i] - c_linha[i] * x[i + 1]
+
+    return np.array(x)
+
+
+def gauss_seidel_esparso(A_in, B_in, x0=None, tol=1e-4, max_iter=500):
+    # Mesma varredura e critério de parada de gauss_seidel, percorrendo só os
+    # elementos não nulos de cada linha (armazenamento por linhas, estilo CSR)
+    A = np.asarray(A_in, dtype=np.float64)
+    b = np.asarray(B_in, dtype=np.float64).tolist()
+    n = len(b)
+    x = [0.0] * n if x0 is None else np.asarray(x0, dtype=np.float64).tolist()
+
+    diagonal = np.diag(A).tolist()
+    for i in range(n):
+        if abs(diagonal[i]) < 1e-9:
+            raise ValueError(f"Divisão por zero na linha {i + 1}")
+
+    fora_diagonal = A.copy()
+    np.fill_diagonal(fora_diagonal, 0.0)
+    colunas = [np.flatnonzero(linha).tolist() for linha in fora_diagonal]
+    valores = [fora_diagonal[i, colunas[i]].tolist() for i in range(n)]
+
+    converged = False
+    iters = max_iter
+    max_err = 0.0
+
+    for k in range(max_iter):
+        max_err = 0.0
+
+        for i in range(n):
+            sigma = 0.0
+            for j, a_ij in zip(colunas[i], valores[i]):
+                sigma += a_ij * x[j]
+
+            x_antigo = x[i]
+            x[i] = (b[i] - sigma) / diagonal[i]
+
+            if abs(x[i]) > 1e-9:
+                err = abs((x[i] - x_antigo) / x[i])
+            else:
+                err = abs(x[i] - x_antigo)
+
+            if err > max_err: max_err = err
+
+        if max_err < tol:
+            converged = True
+            iters = k + 1
+            break
+
+    return np.array(x), converged, iters, max_err
@@ -0,0 +1,125 @@
+# Treliças planas: geometria do exemplo, gerador de treliças em cadeia e forças nas barras
+# pelo método dos nós (equilíbrio em x e y de cada nó, tração positiva).
+# O desenho fica em trelica.py, na raiz.
+import hashlib
+import math
+
+import numpy as np
+
+from calculo_numerico.despacho import resolver_sistema
+from calculo_numerico.sistemas import fatorar_banda, resolver_banda
+
+MAX_DENSO = 2000  # Acima disto o sistema é montado direto no armazenamento em banda
+
+
+def trelica_exemplo():
+    # Mesma treliça de trelica.py / P-trelica-gauss-seidel.py (altura h = 1 metro)
+    n5_x = 2 + 1 / math.tan(math.radians(60))  # Nó 5: sobe de N2 a 60 graus
+    coords = np.array([
+        (0, 0),  # Nó 1: origem
+        (2, 0),  # Nó 2: N1->N4 e N4->N2 a 45 graus
+        (n5_x + 1 / math.tan(math.radians(30)), 0),  # Nó 3: desce de N5 a 30 graus
+        (1, 1),  # Nó 4
+        (n5_x, 1),  # Nó 5
+    ], dtype=np.float64)
+
+    # (Nó_Inicio, Nó_Fim) em índices a partir de 0; nomes F1..F7 como no solver
+    barras = np.array([(0, 3), (0, 1), (3, 1), (3, 4), (1, 4), (1, 2), (4, 2)])
+    nomes = ["F1", "F2", "F3", "F4", "F5", "F6", "F7"]
+    cargas = {3: (0.0, -500.0), 4: (0.0, -100.0)}
+    apoios = {0: "fixo", 2: "movel"}
+    return coords, barras, nomes, cargas, apoios
+
+
+def gerar_trelica_cadeia(n_paineis, vao=1.0, altura=1.0, carga=-100.0):
+    # Treliça Warren: n_paineis + 1 nós embaixo, n_paineis em cima, 4·n_paineis - 1 barras.
+    # Nós e barras numerados ao longo do vão, então o sistema do método dos nós fica em banda.
+    coords = np.empty((2 * n_paineis + 1, 2))
+    coords[0::2, 0] = np.arange(n_paineis + 1) * vao  # Base: índices pares
+    coords[0::2, 1] = 0.0
+    coords[1::2, 0] = (np.arange(n_paineis) + 0.5) * vao  # Topo: índices ímpares
+    coords[1::2, 1] = altura
+
+    base = np.arange(0, 2 * n_paineis, 2)
+    topo = base + 1
+    barras = np.concatenate([
+        np.column_stack([base, base + 2]),  # Banzo inferior
+        np.column_stack([base, topo]),  # Diagonais subindo
+        np.column_stack([topo, base + 2]),  # Diagonais descendo
+        np.column_stack([topo[:-1], topo[1:]]),  # Banzo superior
+    ])
+    barras = barras[np.argsort(barras.min(axis=1), kind="stable")]
+
+    cargas = {int(i): (0.0, carga) for i in topo}
+    apoios = {0: "fixo", 2 * n_paineis: "movel"}
+    return coords, barras, cargas, apoios
+
+
+def _montar_trelica(coords, barras, cargas, apoios):
+    # Incógnitas: uma força por barra + reações (fixo: H e V, móvel: V).
+    # Colunas ordenadas pelo menor nó de cada incógnita para manter a banda estreita.
+    n_nos = len(coords)
+    n_barras = len(barras)
+
+    nos_reacao, direcoes = [], []
+    for no, tipo in sorted(apoios.items()):
+        if tipo == "fixo":
+            nos_reacao += [no, no]
+            direcoes += [0, 1]
+        else:
+            nos_reacao.append(no)
+            direcoes.append(1)
+    n_incognitas = n_barras + len(nos_reacao)
+    if n_incognitas != 2 * n_nos:
+        raise ValueError(f"Treliça não isostática: {n_incognitas} incógnitas para {2 * n_nos} equações.")
+
+    chave = np.concatenate([barras.min(axis=1), nos_reacao])
+    ordem = np.argsort(chave, kind="stable")
+    coluna = np.empty(n_incognitas, dtype=np.int64)
+    coluna[ordem] = np.arange(n_incognitas)
+
+    # Cada barra entra nas equações x/y dos seus dois nós com o cosseno diretor para o outro nó
+    ini, fim = barras[:, 0], barras[:, 1]
+    delta = coords[fim] - coords[ini]
+    direcao = delta / np.linalg.norm(delta, axis=1)[:, None]
+    col_barra = coluna[:n_barras]
+
+    linhas = np.concatenate([2 * ini, 2 * ini + 1, 2 * fim, 2 * fim + 1,
+                             2 * np.array(nos_reacao, dtype=np.int64) + np.array(direcoes, dtype=np.int64)])
+    colunas = np.concatenate([col_barra, col_barra, col_barra, col_barra, coluna[n_barras:]])
+    valores = np.concatenate([direcao[:, 0], direcao[:, 1], -direcao[:, 0], -direcao[:, 1],
+                              np.ones(len(nos_reacao))])
+
+    B = np.zeros(2 * n_nos)
+    for no, (px, py) in cargas.items():
+        B[2 * no] -= px
+        B[2 * no + 1] -= py
+
+    return linhas, colunas, valores, B, coluna
+
+
+def forcas_trelica(coords, barras, cargas, apoios):
+    coords = np.asarray(coords, dtype=np.float64)
+    barras = np.asarray(barras, dtype=np.int64)
+    linhas, colunas, valores, B, coluna = _montar_trelica(coords, barras, cargas, apoios)
+    n = len(B)
+
+    if n <= MAX_DENSO:
+        A = np.zeros((n, n))
+        np.add.at(A, (linhas, colunas), valores)
+        # Chave do padrão a partir das posições montadas (O(não nulos)), sem varrer a matriz densa
+        montadas = np.concatenate([linhas, colunas, valores != 0]).astype(np.int64)
+        chave = hashlib.blake2b(montadas.tobytes(), digest_size=16).hexdigest()
+        resultado = resolver_sistema(A, B, chave_estrutura=("trelica", chave))
+        x, metodo = resultado["x"], resultado["metodo"]
+    else:
+        # Grande demais para a matriz densa: monta direto no armazenamento compacto em banda
+        kl = int(max(0, np.max(linhas - colunas)))
+        ku = int(max(0, np.max(colunas - linhas)))
+        banda = np.zeros((kl + ku + 1, n))
+        np.add.at(banda, (ku + linhas - colunas, colunas), valores)
+        x = resolver_banda(fatorar_banda(banda, kl, ku), B)
+        metodo = "lu_banda"
+
+    n_barras = len(barras)
+    return x[coluna[:n_barras]], x[coluna[n_barras:]], metodo
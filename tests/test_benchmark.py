@@ -0,0 +1,39 @@
+# Comparação com a linha de base: limiar relativo, ruído absoluto e mediana do tempo.
+from calculo_numerico.benchmark import comparar, RUIDO_MEMORIA_BYTES
+
+
+def execucao(tempo_s, tempo_mediano_s, memoria):
+    return {"resultados": [{"kernel": "gauss", "tamanho": 100, "tempo_s": tempo_s,
+                            "tempo_mediano_s": tempo_mediano_s, "memoria_pico_bytes": memoria}]}
+
+
+def test_regressao_de_tempo_pela_mediana():
+    base = execucao(0.010, 0.011, 10 ** 6)
+    # Mínimo 2x pior numa execução ruidosa, mediana igual: não é regressão
+    caso, = comparar(execucao(0.020, 0.011, 10 ** 6), base)
+    assert not caso["regressao"]
+    # Mediana 2x pior: regressão
+    caso, = comparar(execucao(0.010, 0.022, 10 ** 6), base)
+    assert caso["regressao"]
+    assert caso["razao_tempo"] == 2.0
+
+
+def test_linha_de_base_sem_mediana():
+    base = {"resultados": [{"kernel": "gauss", "tamanho": 100, "tempo_s": 0.010, "memoria_pico_bytes": 100}]}
+    caso, = comparar(execucao(0.010, 0.030, 100), base)
+    assert caso["regressao"]
+
+
+def test_ruido_de_memoria_em_casos_pequenos():
+    base = execucao(0.01, 0.01, 600)
+    # +50% mas só algumas centenas de bytes: ruído do tracemalloc
+    caso, = comparar(execucao(0.01, 0.01, 900), base)
+    assert not caso["regressao"]
+    caso, = comparar(execucao(0.01, 0.01, 600 + 2 * RUIDO_MEMORIA_BYTES), base)
+    assert caso["regressao"]
+
+
+def test_sem_casos_em_comum():
+    base = execucao(0.01, 0.01, 100)
+    base["resultados"][0]["kernel"] = "simpson"
+    assert comparar(execucao(0.01, 0.01, 100), base) == []
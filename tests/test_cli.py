@@ -0,0 +1,170 @@
+# Linha de comando em lote: JSON e CSV pela entrada padrão, saída JSON estrita e CSV.
+import csv
+import io
+import json
+
+import numpy as np
+import pytest
+
+from calculo_numerico.cli import main
+from calculo_numerico.quadratura import regra_trapezios, regra_simpson
+
+# Problema das Minas (P-minas-gauss.py), em frações
+A_MINAS = [[0.55, 0.25, 0.25], [0.30, 0.45, 0.20], [0.15, 0.30, 0.55]]
+B_MINAS = [4800.0, 5800.0, 5700.0]
+X_MINAS = np.linalg.solve(A_MINAS, B_MINAS)
+
+
+def rodar(monkeypatch, capsys, argv, entrada=""):
+    monkeypatch.setattr("sys.stdin", io.StringIO(entrada))
+    codigo = main(argv)
+    saida, erro = capsys.readouterr()
+    return codigo, saida, erro
+
+
+def json_estrito(texto):
+    # NaN/Infinity não são JSON válido: falha se a saída tiver algum
+    def recusar(constante):
+        raise AssertionError(f"Constante não JSON na saída: {constante}")
+    return json.loads(texto, parse_constant=recusar)
+
+
+def ler_csv(texto):
+    return list(csv.DictReader(io.StringIO(texto)))
+
+
+#sistemas
+def test_gauss_json(monkeypatch, capsys):
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["gauss"], json.dumps({"A": A_MINAS, "B": B_MINAS}))
+    assert codigo == 0
+    resultado = json_estrito(saida)
+    assert np.allclose(resultado["x"], X_MINAS)
+    assert resultado["erro_residual"] < 1e-9
+
+
+def test_gauss_csv_com_cabecalho(monkeypatch, capsys):
+    entrada = "a1;a2;a3;b\n" + "\n".join(";".join(map(str, linha + [b])) for linha, b in zip(A_MINAS, B_MINAS))
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["gauss", "--formato", "csv"], entrada)
+    assert codigo == 0
+    linhas = ler_csv(saida)
+    assert [linha["variavel"] for linha in linhas] == ["x1", "x2", "x3"]
+    assert np.allclose([float(linha["valor"]) for linha in linhas], X_MINAS)
+
+
+def test_gauss_precisao_mista(monkeypatch, capsys):
+    entrada = json.dumps({"A": A_MINAS, "B": B_MINAS})
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["gauss", "--precisao-mista"], entrada)
+    assert codigo == 0
+    resultado = json_estrito(saida)
+    assert np.allclose(resultado["x"], X_MINAS)
+    assert "passos_refinamento" in resultado
+
+
+def test_seidel_json(monkeypatch, capsys):
+    entrada = json.dumps({"A": A_MINAS, "B": B_MINAS, "x0": [0, 0, 0]})
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["seidel", "--tol", "1e-10", "--max-iter", "1000"], entrada)
+    assert codigo == 0
+    resultado = json_estrito(saida)
+    assert resultado["convergiu"]
+    assert np.allclose(resultado["x"], X_MINAS)
+
+
+def test_resolver_csv(monkeypatch, capsys):
+    entrada = "4,1,0,1\n1,4,1,2\n0,1,4,3\n"
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["resolver", "--formato", "csv"], entrada)
+    assert codigo == 0
+    linhas = ler_csv(saida)
+    A = [[4, 1, 0], [1, 4, 1], [0, 1, 4]]
+    assert np.allclose([float(linha["valor"]) for linha in linhas], np.linalg.solve(A, [1, 2, 3]))
+    assert {linha["metodo"] for linha in linhas} == {"thomas"}
+
+
+def test_sistema_invalido(monkeypatch, capsys):
+    codigo, _, erro = rodar(monkeypatch, capsys, ["gauss"], json.dumps({"A": [[1, 2]], "B": [1]}))
+    assert codigo == 2
+    assert "Sistema inválido" in erro
+
+
+#integração
+Y_NAVIO = [3.00, 2.92, 2.75, 2.52, 2.30, 1.84, 0.92, 0.00]
+
+
+def test_integrar_json(monkeypatch, capsys):
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["integrar"], json.dumps({"h": 0.4, "y": Y_NAVIO}))
+    assert codigo == 0
+    resultado = json_estrito(saida)
+    assert resultado["n_intervalos"] == 7
+    assert resultado["trapezios"] == pytest.approx(regra_trapezios(0.4, np.array(Y_NAVIO)))
+    assert resultado["simpson"] == pytest.approx(regra_simpson(0.4, np.array(Y_NAVIO)))
+
+
+def test_integrar_csv_com_h(monkeypatch, capsys):
+    entrada = ", ".join(map(str, Y_NAVIO))
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["integrar", "--h", "0.4", "--formato", "csv"], entrada)
+    assert codigo == 0
+    linha, = ler_csv(saida)
+    assert float(linha["trapezios"]) == pytest.approx(regra_trapezios(0.4, np.array(Y_NAVIO)))
+
+
+def test_integrar_json_sem_h(monkeypatch, capsys):
+    codigo, saida, erro = rodar(monkeypatch, capsys, ["integrar"], json.dumps({"y": Y_NAVIO}))
+    assert codigo == 2
+    assert saida == ""
+    assert "passo h" in erro
+
+
+#MMQ
+def test_mmq_json_uma_serie(monkeypatch, capsys):
+    x = [1971, 1981, 1991, 2001]
+    N = [10 ** (0.15 * (ano - 1971) + 3) for ano in x]
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["mmq"], json.dumps({"x": x, "N": N}))
+    assert codigo == 0
+    serie, = json_estrito(saida)["series"]
+    assert serie["n"] == 4
+    assert serie["beta"] == pytest.approx(0.15)
+    assert serie["r2"] == pytest.approx(1.0)
+
+
+def test_mmq_csv_cabecalho_e_ids_textuais(monkeypatch, capsys):
+    entrada = "series_id,x,N\ncpu,1,10\ncpu,2,100\ncpu,3,1000\ngpu,1,10\ngpu,2,1000\ngpu,3,100000\n"
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["mmq", "--formato", "csv"], entrada)
+    assert codigo == 0
+    linhas = ler_csv(saida)
+    assert [linha["series_id"] for linha in linhas] == ["cpu", "gpu"]
+    assert [float(linha["beta"]) for linha in linhas] == pytest.approx([1.0, 2.0])
+
+
+def test_mmq_csv_ids_numericos(monkeypatch, capsys):
+    entrada = "1,1,10\n1,2,100\n1,3,1000\n2,1,1\n2,2,10\n2,3,100\n"
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["mmq"], entrada)
+    assert codigo == 0
+    series = json_estrito(saida)["series"]
+    assert [s["series_id"] for s in series] == [1, 2]
+
+
+def test_mmq_ajuste_degenerado_gera_json_valido(monkeypatch, capsys):
+    # Dois pontos: desvio dos resíduos (n - 2) não existe e sai como null
+    entrada = json.dumps({"series_id": ["a", "a"], "x": [1, 2], "N": [10, 100]})
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["mmq"], entrada)
+    assert codigo == 0
+    serie, = json_estrito(saida)["series"]
+    assert serie["desvio"] is None
+
+
+@pytest.mark.filterwarnings("error")
+def test_mmq_previsao_fora_de_float64(monkeypatch, capsys):
+    # x pequeno e previsão em 2030: 10^10146 não cabe em float64, mas o log10 sim
+    entrada = "b,1,10\nb,2,1e6\n"
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["mmq", "--previsao", "2030"], entrada)
+    assert codigo == 0
+    serie, = json_estrito(saida)["series"]
+    assert serie["previsao"] is None
+    assert serie["previsao_log10"] == pytest.approx(-4 + 5 * 2030)
+
+
+def test_mmq_previsao(monkeypatch, capsys):
+    entrada = "1,10\n2,100\n3,1000\n"
+    codigo, saida, _ = rodar(monkeypatch, capsys, ["mmq", "--previsao", "4", "--formato", "csv"], entrada)
+    assert codigo == 0
+    linha, = ler_csv(saida)
+    assert float(linha["previsao"]) == pytest.approx(1e4)
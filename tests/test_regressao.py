@@ -0,0 +1,141 @@
+# MMQ exponencial: bootstrap (serial x pool de processos) e ajuste de várias séries de uma vez,
+# conferido contra o ajuste série a série.
+import numpy as np
+import pytest
+
+from calculo_numerico import regressao
+from calculo_numerico.regressao import (calcular_mmq_detalhado, ajustar_mmq_multiplas, ajustar_mmq_agrupado,
+                                        bootstrap_mmq, intervalos_confianca, ANOS_MOORE, TRANSISTORES_MOORE)
+
+
+def series_sinteticas(semente=0):
+    # Três séries de tamanhos diferentes, com ruído em log10
+    rng = np.random.default_rng(semente)
+    series = []
+    for n, beta, B in [(11, 0.15, -290.0), (5, 0.3, -590.0), (8, -0.05, 104.0)]:
+        x = np.sort(rng.uniform(1970, 2010, n))
+        N = 10 ** (beta * x + B + rng.normal(0, 0.1, n))
+        series.append((x, N))
+    return series
+
+
+def esperado_por_serie(series):
+    beta, B_linear = [], []
+    for x, N in series:
+        _, _, _, _, b, B, _ = calcular_mmq_detalhado(x, N)
+        beta.append(b)
+        B_linear.append(B)
+    return np.array(beta), np.array(B_linear)
+
+
+def test_listas_de_tamanhos_diferentes():
+    series = series_sinteticas()
+    beta, B_linear = esperado_por_serie(series)
+
+    ajuste = ajustar_mmq_multiplas([x for x, _ in series], [N for _, N in series])
+    assert ajuste["n"].tolist() == [11, 5, 8]
+    assert np.allclose(ajuste["beta"], beta)
+    assert np.allclose(ajuste["B_linear"], B_linear)
+
+
+def test_matriz_preenchida_com_mascara():
+    series = series_sinteticas()
+    beta, B_linear = esperado_por_serie(series)
+
+    x = np.full((3, 11), 1234.0)  # Preenchimento fora da máscara não pode influir
+    N = np.full((3, 11), 99.0)
+    mascara = np.zeros((3, 11), dtype=bool)
+    for i, (xs, Ns) in enumerate(series):
+        x[i, :len(xs)], N[i, :len(Ns)], mascara[i, :len(xs)] = xs, Ns, True
+
+    ajuste = ajustar_mmq_multiplas(x, N, mascara)
+    assert np.allclose(ajuste["beta"], beta)
+    assert np.allclose(ajuste["B_linear"], B_linear)
+
+
+def test_preenchimento_com_nan_fica_de_fora():
+    series = series_sinteticas()
+    beta, B_linear = esperado_por_serie(series)
+
+    x = np.full((3, 11), np.nan)
+    N = np.full((3, 11), np.nan)
+    for i, (xs, Ns) in enumerate(series):
+        x[i, :len(xs)], N[i, :len(Ns)] = xs, Ns
+    N[0, 3] = np.nan  # Ponto ausente no meio da série
+    (beta[0],), (B_linear[0],) = esperado_por_serie([(np.delete(series[0][0], 3), np.delete(series[0][1], 3))])
+
+    ajuste = ajustar_mmq_multiplas(x, N)
+    assert ajuste["n"].tolist() == [10, 5, 8]
+    assert np.allclose(ajuste["beta"], beta)
+    assert np.allclose(ajuste["B_linear"], B_linear)
+
+
+def test_formato_agrupado():
+    series = series_sinteticas()
+    beta, B_linear = esperado_por_serie(series)
+
+    ids = np.concatenate([[f"s{i}"] * len(x) for i, (x, _) in enumerate(series)])
+    x = np.concatenate([x for x, _ in series])
+    N = np.concatenate([N for _, N in series])
+    ordem = np.random.default_rng(1).permutation(len(x))  # Linhas em qualquer ordem
+
+    ajuste = ajustar_mmq_agrupado(ids[ordem], x[ordem], N[ordem])
+    assert ajuste["series_id"].tolist() == ["s0", "s1", "s2"]
+    assert np.allclose(ajuste["beta"], beta)
+    assert np.allclose(ajuste["B_linear"], B_linear)
+
+
+def test_r2_e_desvio_contra_calculo_direto():
+    x = np.array(ANOS_MOORE, dtype=np.float64)
+    y = np.log10(TRANSISTORES_MOORE)
+    ajuste = ajustar_mmq_multiplas(x, TRANSISTORES_MOORE)
+
+    residuos = y - (ajuste["beta"][0] * x + ajuste["B_linear"][0])
+    r2 = 1 - np.sum(residuos ** 2) / np.sum((y - y.mean()) ** 2)
+    desvio = np.sqrt(np.sum(residuos ** 2) / (len(x) - 2))
+    assert ajuste["r2"][0] == pytest.approx(r2)
+    assert ajuste["desvio"][0] == pytest.approx(desvio)
+    assert ajuste["r2"][0] == pytest.approx(np.corrcoef(x, y)[0, 1] ** 2)
+
+
+def test_sem_series():
+    for ajuste in (ajustar_mmq_multiplas([], []), ajustar_mmq_agrupado([], [], [])):
+        assert len(ajuste["n"]) == 0
+        assert len(ajuste["beta"]) == 0
+
+
+def test_tamanhos_inconsistentes():
+    with pytest.raises(ValueError):
+        ajustar_mmq_multiplas([[1, 2, 3]], [[10, 100]])
+
+
+#bootstrap
+@pytest.mark.parametrize("metodo", ["pares", "monte_carlo"])
+def test_bootstrap_serial_igual_ao_pool(monkeypatch, metodo):
+    # Blocos pequenos e limiar baixo para o pool de processos entrar com poucas reamostras
+    monkeypatch.setattr(regressao, "TAMANHO_BLOCO", 300)
+    monkeypatch.setattr(regressao, "LIMIAR_PARALELO", 1)
+    x_ano, _, y_log, _, beta, B_linear, _ = calcular_mmq_detalhado()
+
+    serial = bootstrap_mmq(x_ano, y_log, 1000, semente=7, metodo=metodo, n_processos=1)
+    pool = bootstrap_mmq(x_ano, y_log, 1000, semente=7, metodo=metodo, n_processos=2)
+    assert np.array_equal(serial[0], pool[0])
+    assert np.array_equal(serial[1], pool[1])
+
+    ic = intervalos_confianca(*serial, x_prev=[1990, 2010])
+    assert ic["beta"][0] <= beta <= ic["beta"][1]
+    log_pontual = beta * ic["x"] + B_linear
+    assert np.all((ic["log_inf"] <= log_pontual) & (log_pontual <= ic["log_sup"]))
+
+
+def test_bootstrap_repoe_reamostras_degeneradas():
+    # Com x = [1, 1, 1, 1, 2] cerca de 1/3 das reamostras têm só x = 1 e não definem reta
+    beta, B_linear = bootstrap_mmq([1, 1, 1, 1, 2], [1.0, 1.2, 0.9, 1.1, 2.0], 100, metodo="pares")
+    assert len(beta) == len(B_linear) == 100
+    assert np.all(np.isfinite(beta))
+
+
+@pytest.mark.parametrize("x_ano", [[2000, 2001], [2000, 2000, 2000]])
+def test_bootstrap_entradas_invalidas(x_ano):
+    with pytest.raises(ValueError):
+        bootstrap_mmq(x_ano, np.ones(len(x_ano)), 10)
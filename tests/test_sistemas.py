@@ -0,0 +1,242 @@
+# Solvers com estrutura (banda, Thomas) e rotas do despacho, conferidos contra np.linalg.solve.
+import numpy as np
+import pytest
+
+from calculo_numerico.despacho import resolver_sistema, inspecionar_matriz
+from calculo_numerico.sistemas import (matriz_para_banda, fatorar_banda, resolver_banda, resolver_thomas,
+                                       resolver_gauss_refinado)
+
+
+def matriz_banda(n, kl, ku, rng, dominante=False):
+    A = np.zeros((n, n))
+    for d in range(-kl, ku + 1):
+        A += np.diag(rng.uniform(-1, 1, n - abs(d)), d)
+    if dominante:
+        A[np.diag_indices(n)] = np.sum(np.abs(A), axis=1) + 1
+    return A
+
+
+#LU em banda com pivoteamento
+@pytest.mark.parametrize("semente", range(20))
+def test_lu_banda_aleatoria(semente):
+    # Sem dominância diagonal: o pivoteamento precisa trocar linhas e preencher acima da banda.
+    # Bandas triangulares (kl ou ku = 0) ficam no teste seguinte: sem troca possível, uma
+    # diagonal sorteada perto de zero deixa o sistema mal condicionado demais para comparar.
+    rng = np.random.default_rng(semente)
+    n = int(rng.integers(5, 60))
+    kl, ku = (int(k) for k in rng.integers(1, 6, size=2))
+    A = matriz_banda(n, kl, ku, rng)
+    b = rng.uniform(-10, 10, n)
+
+    x = resolver_banda(fatorar_banda(matriz_para_banda(A, kl, ku), kl, ku), b)
+    assert np.allclose(x, np.linalg.solve(A, b))
+
+
+@pytest.mark.parametrize("kl, ku", [(0, 0), (0, 3), (3, 0), (1, 1), (5, 2)])
+def test_lu_banda_triangular_e_larguras_fixas(kl, ku):
+    rng = np.random.default_rng(kl * 10 + ku)
+    A = matriz_banda(40, kl, ku, rng)
+    A[np.diag_indices(40)] += np.sign(np.diag(A)) * 0.5  # Triangulares: diagonal longe de zero
+    b = rng.uniform(-10, 10, 40)
+
+    x = resolver_banda(fatorar_banda(matriz_para_banda(A, kl, ku), kl, ku), b)
+    assert np.allclose(x, np.linalg.solve(A, b))
+
+
+@pytest.mark.parametrize("kl, ku", [(4, 1), (1, 4), (6, 6)])
+def test_lu_banda_mais_larga_que_a_matriz(kl, ku):
+    rng = np.random.default_rng(kl + 10 * ku)
+    A = matriz_banda(4, min(kl, 3), min(ku, 3), rng, dominante=True)  # Diagonais além da 3ª não existem
+    b = rng.uniform(-10, 10, 4)
+
+    banda = matriz_para_banda(A, kl, ku)
+    assert banda.shape == (kl + ku + 1, 4)
+    x = resolver_banda(fatorar_banda(banda, kl, ku), b)
+    assert np.allclose(x, np.linalg.solve(A, b))
+
+
+def test_lu_banda_pivo_nulo_obrigatorio():
+    # A[0, 0] = 0: só funciona trocando a linha 0 com a 1
+    A = np.array([[0.0, 2.0, 0.0], [1.0, 1.0, 3.0], [0.0, 4.0, 1.0]])
+    b = np.array([1.0, 2.0, 3.0])
+    x = resolver_banda(fatorar_banda(matriz_para_banda(A, 1, 1), 1, 1), b)
+    assert np.allclose(x, np.linalg.solve(A, b))
+
+
+def test_lu_banda_singular():
+    A = np.array([[1.0, 2.0, 0.0], [2.0, 4.0, 0.0], [0.0, 1.0, 1.0]])
+    with pytest.raises(ValueError):
+        fatorar_banda(matriz_para_banda(A, 1, 1), 1, 1)
+
+
+#precisão mista
+@pytest.mark.filterwarnings("error")
+def test_gauss_refinado_estouro_float32_sem_aviso():
+    # 1e39 não cabe em float32: cai para float64 sem vazar RuntimeWarning
+    A = np.eye(3) * 1e39
+    b = np.array([1.0, 2.0, 3.0])
+    resultado = resolver_gauss_refinado(A, b)
+    assert resultado["fallback_float64"]
+    assert np.allclose(A @ resultado["x"], b)  # x ~ 1e-39: comparar x direto passaria pelo atol
+
+
+@pytest.mark.filterwarnings("error")
+def test_gauss_refinado_estouro_em_B_sem_aviso():
+    # A cabe em float32, mas B não: o estouro aparece só no cast do lado direito
+    resultado = resolver_gauss_refinado(np.eye(2), [1e39, 1.0])
+    assert resultado["fallback_float64"]
+    assert np.allclose(resultado["x"], [1e39, 1.0])
+
+
+def test_gauss_refinado_bem_condicionado():
+    # Refinamento em float64 sobre fatores float32 chega à precisão de float64 em poucos passos
+    rng = np.random.default_rng(7)
+    A = rng.uniform(-1, 1, size=(100, 100))
+    A[np.diag_indices(100)] += np.sum(np.abs(A), axis=1)
+    b = rng.uniform(-10, 10, 100)
+
+    resultado = resolver_gauss_refinado(A, b)
+    assert not resultado["fallback_float64"]
+    assert 1 <= resultado["passos_refinamento"] <= 3
+    assert np.allclose(resultado["x"], np.linalg.solve(A, b), rtol=1e-12, atol=0)
+    assert resultado["erro_residual"] <= 1e-12 * np.linalg.norm(b)
+
+
+def test_gauss_refinado_mal_condicionado_volta_para_float64():
+    # Hilbert 10x10 (cond ~ 1e13): os fatores float32 não reduzem o resíduo e o refinamento estagna
+    n = 10
+    H = 1.0 / (np.arange(n)[:, None] + np.arange(n)[None, :] + 1)
+    b = H @ np.ones(n)
+
+    resultado = resolver_gauss_refinado(H, b)
+    assert resultado["fallback_float64"]
+    assert np.allclose(H @ resultado["x"], b)
+
+
+def test_gauss_refinado_mede_speedup():
+    rng = np.random.default_rng(8)
+    A = rng.uniform(-1, 1, size=(50, 50))
+    b = rng.uniform(-10, 10, 50)
+
+    assert resolver_gauss_refinado(A, b)["speedup"] is None
+    resultado = resolver_gauss_refinado(A, b, medir_speedup=True)
+    assert resultado["speedup"] > 0
+    assert resultado["tempo_s"] > 0
+
+
+#Thomas
+@pytest.mark.parametrize("n", [1, 2, 3, 50])
+def test_thomas(n):
+    rng = np.random.default_rng(n)
+    A = matriz_banda(n, 1, 1, rng, dominante=True)
+    d = rng.uniform(-10, 10, n)
+
+    x = resolver_thomas(np.diagonal(A, -1), np.diagonal(A), np.diagonal(A, 1), d)
+    assert np.allclose(x, np.linalg.solve(A, d))
+
+
+def test_thomas_pivo_nulo():
+    with pytest.raises(ValueError):
+        resolver_thomas([1.0], [0.0, 1.0], [1.0], [1.0, 1.0])
+
+
+#rotas do despacho
+def sistema_esparso_largo(n, rng):
+    # ~3 não nulos por linha em posições aleatórias: banda larga, densidade baixa
+    A = np.zeros((n, n))
+    linhas = np.repeat(np.arange(n), 3)
+    A[linhas, rng.integers(0, n, size=3 * n)] = rng.uniform(-1, 1, 3 * n)
+    A[0, n - 1] = A[n - 1, 0] = 0.5
+    A[np.diag_indices(n)] = np.sum(np.abs(A), axis=1) + 1
+    return A
+
+
+def test_rota_thomas():
+    rng = np.random.default_rng(1)
+    A = matriz_banda(100, 1, 1, rng, dominante=True)
+    B = rng.uniform(-10, 10, 100)
+    resultado = resolver_sistema(A, B)
+    assert resultado["metodo"] == "thomas"
+    assert np.allclose(resultado["x"], np.linalg.solve(A, B))
+
+
+def test_rota_lu_banda():
+    rng = np.random.default_rng(2)
+    A = matriz_banda(100, 2, 3, rng)
+    B = rng.uniform(-10, 10, 100)
+    resultado = resolver_sistema(A, B)
+    assert resultado["metodo"] == "lu_banda"
+    assert np.allclose(resultado["x"], np.linalg.solve(A, B))
+
+
+def test_rota_gauss_seidel_esparso():
+    rng = np.random.default_rng(3)
+    A = sistema_esparso_largo(200, rng)
+    B = rng.uniform(-10, 10, 200)
+    resultado = resolver_sistema(A, B)
+    assert resultado["metodo"] == "gauss_seidel_esparso"
+    assert resultado["iteracoes"] is not None
+    assert np.allclose(resultado["x"], np.linalg.solve(A, B))
+
+
+def test_rota_lu_denso():
+    rng = np.random.default_rng(4)
+    A = rng.uniform(-1, 1, size=(30, 30))
+    B = rng.uniform(-10, 10, 30)
+    resultado = resolver_sistema(A, B)
+    assert resultado["metodo"] == "lu_denso"
+    assert np.allclose(resultado["x"], np.linalg.solve(A, B))
+
+
+def test_tridiagonal_fracamente_dominante_redutivel_vai_para_lu_banda():
+    # Dominância fraca com um zero na superdiagonal: o Thomas não tem garantia de pivô não nulo
+    rng = np.random.default_rng(5)
+    A = matriz_banda(40, 1, 1, rng)
+    A[10, 11] = 0.0
+    A[np.diag_indices(40)] = np.sum(np.abs(A), axis=1) - np.abs(np.diag(A))
+    A[0, 0] += 1.0  # Uma linha estrita
+    B = rng.uniform(-10, 10, 40)
+
+    resultado = resolver_sistema(A, B)
+    assert resultado["metodo"] == "lu_banda"
+    assert np.allclose(resultado["x"], np.linalg.solve(A, B))
+
+
+def test_tridiagonal_fracamente_dominante_irredutivel_usa_thomas():
+    # Laplaciano 1D com a primeira linha estrita: dominância fraca, mas irredutível e não singular
+    n = 30
+    A = 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    A[n - 1, n - 1] = 1.0
+    B = np.ones(n)
+
+    resultado = resolver_sistema(A, B)
+    assert resultado["metodo"] == "thomas"
+    assert np.allclose(resultado["x"], np.linalg.solve(A, B))
+
+
+def test_cache_com_chave_do_chamador():
+    rng = np.random.default_rng(9)
+    A = matriz_banda(60, 2, 3, rng)
+    sem_chave = inspecionar_matriz(A)
+
+    primeira = inspecionar_matriz(A, ("teste", "banda-60"))
+    segunda = inspecionar_matriz(A * 2.0, ("teste", "banda-60"))  # Mesmo padrão, outros valores
+    assert not primeira["em_cache"]
+    assert segunda["em_cache"]
+    for campo in ("kl", "ku", "densidade", "diagonal_dominante"):
+        assert primeira[campo] == sem_chave[campo] == segunda[campo]
+
+    resultado = resolver_sistema(A, np.ones(60), chave_estrutura=("teste", "banda-60"))
+    assert resultado["estrutura"]["em_cache"]
+    assert np.allclose(resultado["x"], np.linalg.solve(A, np.ones(60)))
+
+
+def test_fallback_gauss_seidel_para_lu_denso():
+    # Uma iteração só não basta para a tolerância: a resposta vem da LU densa
+    rng = np.random.default_rng(6)
+    A = sistema_esparso_largo(200, rng)
+    B = rng.uniform(-10, 10, 200)
+    resultado = resolver_sistema(A, B, tol=1e-12, max_iter=1)
+    assert resultado["metodo"] == "lu_denso"
+    assert "não convergiu" in resultado["motivo"]
+    assert np.allclose(resultado["x"], np.linalg.solve(A, B))
@@ -0,0 +1,56 @@
+# Desenho da treliça sem display (Agg) e rótulos por zoom.
+import io
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from matplotlib.backend_bases import TimerBase
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import trelica
+
+
+class TimerManual(TimerBase):
+    # Timer de um laço de eventos de mentira: só dispara quando o teste manda
+    def __init__(self, *args, **kwargs):
+        self.iniciado = 0
+        super().__init__(*args, **kwargs)
+
+    def _timer_start(self):
+        self.iniciado += 1
+
+    def disparar(self):
+        self._on_timer()
+
+
+class CanvasComLaco(FigureCanvasAgg):
+    def new_timer(self, *args, **kwargs):
+        return TimerManual(*args, **kwargs)
+
+
+def test_desenho_sem_display_gera_png():
+    arquivo = io.BytesIO()
+    fig = trelica.desenhar_trelica(arquivo=arquivo, formato="png")
+    assert arquivo.getvalue().startswith(b"\x89PNG")
+    assert fig.rotulos_por_zoom.artistas  # Treliça pequena: rótulos de barras e nós
+
+
+def test_zoom_reconstroi_rotulos_uma_vez(monkeypatch):
+    fig = trelica.desenhar_trelica(arquivo=io.BytesIO(), formato="png")
+    ax = fig.axes[0]
+    CanvasComLaco(fig)  # Troca o canvas Agg por um com laço de eventos
+    original = fig.rotulos_por_zoom
+    rotulos = trelica.RotulosPorZoom(ax, original.meios, original.textos_barras, original.cores_barras,
+                                     original.coords)
+    chamadas = []
+    monkeypatch.setattr(rotulos, "atualizar", lambda: chamadas.append(1))
+
+    # Zoom da barra de ferramentas: x e depois y, antes de o laço de eventos rodar
+    ax.set_xlim(0, 2)
+    ax.set_ylim(-0.5, 1.5)
+    assert rotulos.timer.iniciado == 1
+    assert chamadas == []
+
+    rotulos.timer.disparar()
+    assert chamadas == [1]
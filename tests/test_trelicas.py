@@ -0,0 +1,84 @@
+# Forças nas barras pelo método dos nós: exemplo do trabalho, caminhos denso e em banda, equilíbrio.
+import numpy as np
+import pytest
+
+from calculo_numerico import trelicas
+from calculo_numerico.trelicas import trelica_exemplo, gerar_trelica_cadeia, forcas_trelica
+
+
+def reacoes_por_no(apoios, reacoes, n_nos):
+    # Mesma ordem de _montar_trelica: apoios por nó, fixo com (H, V) e móvel com V
+    forcas = np.zeros((n_nos, 2))
+    k = 0
+    for no, tipo in sorted(apoios.items()):
+        if tipo == "fixo":
+            forcas[no] = reacoes[k], reacoes[k + 1]
+            k += 2
+        else:
+            forcas[no, 1] = reacoes[k]
+            k += 1
+    return forcas
+
+
+def residuo_nos(coords, barras, forcas, cargas, apoios, reacoes):
+    # Soma das forças em cada nó: barras (tração puxa o nó para a outra ponta) + cargas + reações
+    total = reacoes_por_no(apoios, reacoes, len(coords))
+    for no, carga in cargas.items():
+        total[no] += carga
+    delta = coords[barras[:, 1]] - coords[barras[:, 0]]
+    direcao = delta / np.linalg.norm(delta, axis=1)[:, None]
+    np.add.at(total, barras[:, 0], forcas[:, None] * direcao)
+    np.add.at(total, barras[:, 1], -forcas[:, None] * direcao)
+    return total
+
+
+def test_exemplo_igual_ao_sistema_de_p_trelica():
+    # Solução do sistema padrão de P-trelica-gauss-seidel.py (F1..F7, V1, V3)
+    coords, barras, _, cargas, apoios = trelica_exemplo()
+    forcas, reacoes, _ = forcas_trelica(coords, barras, cargas, apoios)
+
+    assert forcas == pytest.approx([-599.86, 424.17, -107.24, -348.33, 87.56, 304.55, -351.67], abs=0.01)
+    H1, V1, V3 = reacoes
+    assert H1 == pytest.approx(0.0, abs=1e-9)
+    assert V1 == pytest.approx(424.17, abs=0.01)
+    assert V3 == pytest.approx(175.83, abs=0.01)
+
+
+def test_caminhos_denso_e_banda_concordam(monkeypatch):
+    coords, barras, cargas, apoios = gerar_trelica_cadeia(30)
+    forcas_denso, reacoes_denso, _ = forcas_trelica(coords, barras, cargas, apoios)
+
+    monkeypatch.setattr(trelicas, "MAX_DENSO", 10)
+    forcas_banda, reacoes_banda, metodo_banda = forcas_trelica(coords, barras, cargas, apoios)
+
+    assert metodo_banda == "lu_banda"
+    assert np.allclose(forcas_banda, forcas_denso)
+    assert np.allclose(reacoes_banda, reacoes_denso)
+
+
+@pytest.mark.parametrize("n_paineis, max_denso", [(5, trelicas.MAX_DENSO), (200, 10)])
+def test_reacoes_equilibram_cargas(monkeypatch, n_paineis, max_denso):
+    monkeypatch.setattr(trelicas, "MAX_DENSO", max_denso)
+    coords, barras, cargas, apoios = gerar_trelica_cadeia(n_paineis, carga=-250.0)
+    forcas, reacoes, _ = forcas_trelica(coords, barras, cargas, apoios)
+
+    # Globalmente: reações anulam a soma das cargas; localmente: cada nó em equilíbrio
+    soma_cargas = np.sum(list(cargas.values()), axis=0)
+    soma_reacoes = reacoes_por_no(apoios, reacoes, len(coords)).sum(axis=0)
+    assert np.allclose(soma_reacoes + soma_cargas, 0.0)
+    assert np.allclose(residuo_nos(coords, barras, forcas, cargas, apoios, reacoes), 0.0, atol=1e-8)
+
+
+def test_cadeia_simetrica_tem_reacoes_iguais():
+    coords, barras, cargas, apoios = gerar_trelica_cadeia(8, carga=-100.0)
+    _, (H, V_fixo, V_movel), _ = forcas_trelica(coords, barras, cargas, apoios)
+    assert H == pytest.approx(0.0, abs=1e-9)
+    assert V_fixo == pytest.approx(400.0)
+    assert V_movel == pytest.approx(400.0)
+
+
+def test_trelica_nao_isostatica():
+    coords, barras, _, cargas, apoios = trelica_exemplo()
+    barras_extra = np.vstack([barras, [(0, 4)]])  # Barra redundante: 8 + 3 incógnitas para 10 equações
+    with pytest.raises(ValueError, match="não isostática"):
+        forcas_trelica(coords, barras_extra, cargas, apoios)
@@ -1,97 +1,206 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 import math
 
-
-def desenhar_trelica():
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-    # --- 1. Definindo as Coordenadas dos Nós (Geometria) ---
-    # Assumindo altura h = 1 metro para facilitar a proporção
-    h = 1.0
-
-    # Nó 1: Origem (0,0)
-    n1 = (0, 0)
-
-    # Nó 4: Sobe a 45 graus. Se h=1, x=1 (tan 45 = 1)
-    n4 = (1, 1)
-
-    # Nó 2: Base do triângulo esquerdo. Simétrico ao eixo Y do triângulo se fosse isósceles,
-    # mas aqui desce de N4 a 45 graus para a direita? Não, a imagem mostra geometria.
-    # N1->N4 (45deg). N4->N2 (45deg). Então N2 está em x=2.
-    n2 = (2, 0)
-
-    # Nó 5: Topo direita. Conectado ao N2 a 60 graus.
-    # dx = h / tan(60) = 1 / 1.732 = 0.577
-    # x_n5 = x_n2 + 0.577 = 2.577
-    n5 = (2 + 1 / math.tan(math.radians(60)), 1)
-
-    # Nó 3: Base direita. Conectado ao N5 a 30 graus.
-    # dx = h / tan(30) = 1 / 0.577 = 1.732
-    # x_n3 = x_n5 + 1.732
-    n3 = (n5[0] + 1 / math.tan(math.radians(30)), 0)
-
-    nodes = {1: n1, 2: n2, 3: n3, 4: n4, 5: n5}
-
-    # --- 2. Definindo as Barras (Conexões) e Labels das Forças ---
-    # Formato: (Nó_Inicio, Nó_Fim, Nome_Força, Cor)
-    bars = [
-        (1, 4, "F1", "blue"),
-        (1, 2, "F2", "green"),
-        (4, 2, "F3", "purple"),
-        (4, 5, "F4", "orange"),
-        (2, 5, "F5", "brown"),
-        (2, 3, "F6", "green"),
-        (5, 3, "F7", "blue")
-    ]
-
-    # --- 3. Desenhando as Barras ---
-    for start, end, label, color in bars:
-        x_vals = [nodes[start][0], nodes[end][0]]
-        y_vals = [nodes[start][1], nodes[end][1]]
-
-        # Linha da barra
-        ax.plot(x_vals, y_vals, color='black', linewidth=2, zorder=1)
-
-        # Texto da Força (no meio da barra)
-        mid_x = sum(x_vals) / 2
-        mid_y = sum(y_vals) / 2
-
-        # Ajuste fino para o texto não ficar em cima da linha
-        offset = 0.15
-        ax.text(mid_x, mid_y + 0.05, label, color=color, fontsize=12, fontweight='bold',
-                bbox=dict(facecolor='white', edgecolor='none', alpha=0.7), ha='center')
-
-    # --- 4. Desenhando os Nós ---
-    for n_id, (nx, ny) in nodes.items():
-        ax.plot(nx, ny, 'ko', markersize=10, zorder=2)  # Bolinha preta
-        ax.text(nx, ny - 0.2, f"Nó {n_id}", ha='center', fontsize=9)
-
-    # --- 5. Desenhando as Cargas (Setas) ---
-    # Carga 500 no Nó 4
-    ax.arrow(n4[0], n4[1] + 0.8, 0, -0.6, head_width=0.1, head_length=0.2, fc='red', ec='red', width=0.02)
-    ax.text(n4[0], n4[1] + 0.9, "500", color='red', ha='center', fontweight='bold')
-
-    # Carga 100 no Nó 5
-    ax.arrow(n5[0], n5[1] + 0.8, 0, -0.6, head_width=0.1, head_length=0.2, fc='red', ec='red', width=0.02)
-    ax.text(n5[0], n5[1] + 0.9, "100", color='red', ha='center', fontweight='bold')
-
-    # --- 6. Apoios (Representação Simplificada) ---
-    # Apoio Fixo (Nó 1) - Triângulo
-    ax.plot([n1[0], n1[0] - 0.2, n1[0] + 0.2, n1[0]], [n1[1], n1[1] - 0.2, n1[1] - 0.2, n1[1]], 'k-', linewidth=1)
-    # Apoio Móvel (Nó 3) - Triângulo + Bolinhas
-    ax.plot([n3[0], n3[0] - 0.2, n3[0] + 0.2, n3[0]], [n3[1], n3[1] - 0.2, n3[1] - 0.2, n3[1]], 'k-', linewidth=1)
-    ax.plot(n3[0] - 0.1, n3[1] - 0.25, 'ko', markersize=4)
-    ax.plot(n3[0] + 0.1, n3[1] - 0.25, 'ko', markersize=4)
+import numpy as np
+from matplotlib.backend_bases import TimerBase
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from calculo_numerico.trelicas import trelica_exemplo, forcas_trelica
+
+LIMITE_ROTULOS = 200  # Só escreve rótulos quando até esta quantidade de barras/nós está à vista...
+PIXELS_POR_ROTULO = 60  # ...e cada um tem em média pelo menos esta largura de tela
+COR_TRACAO = "blue"
+COR_COMPRESSAO = "red"
+COR_NEUTRA = "gray"
+
+
+def cores_por_forca(forcas, tol=1e-9):
+    # Tração (F > 0) em azul e compressão (F < 0) em vermelho, como no solver da treliça
+    forcas = np.asarray(forcas)
+    cores = np.full(len(forcas), COR_NEUTRA, dtype=object)
+    cores[forcas > tol] = COR_TRACAO
+    cores[forcas < -tol] = COR_COMPRESSAO
+    return cores
+
+
+def _linhas_por_cor(segmentos, cores):
+    # Uma polilinha por cor, com NaN separando as barras: a LineCollection fica com 3 caminhos
+    # em vez de um objeto Path por barra, que é o que domina o tempo com 10^5 barras
+    polilinhas, cores_unicas = [], []
+    for cor in dict.fromkeys(cores):
+        grupo = segmentos[cores == cor]
+        linhas = np.full((len(grupo), 3, 2), np.nan)
+        linhas[:, :2] = grupo
+        polilinhas.append(linhas.reshape(-1, 2)[:-1])
+        cores_unicas.append(cor)
+    return polilinhas, cores_unicas
+
+
+class RotulosPorZoom:
+    # Recria os textos a cada mudança de limites do eixo, apenas para barras e nós
+    # visíveis, e nenhum enquanto houver mais itens na tela do que cabem legíveis.
+    def __init__(self, ax, meios, textos_barras, cores_barras, coords, limite=LIMITE_ROTULOS):
+        self.ax = ax
+        self.meios = meios
+        self.textos_barras = textos_barras
+        self.cores_barras = cores_barras
+        self.coords = coords
+        self.limite = limite
+        self.artistas = []
+
+        # Um zoom/pan muda x e depois y (ou só um deles, no zoom com tecla x/y): os dois eventos
+        # agendam uma única reconstrução no laço de eventos da janela. Sem laço (Agg), o timer
+        # nunca dispara, então cada mudança atualiza na hora.
+        timer = ax.figure.canvas.new_timer(interval=0)
+        if type(timer) is TimerBase:
+            self.timer = None
+        else:
+            timer.single_shot = True
+            timer.add_callback(self._atualizar_agendado)
+            self.timer = timer
+        self.agendado = False
+
+        ax.callbacks.connect("xlim_changed", self._limites_mudaram)
+        ax.callbacks.connect("ylim_changed", self._limites_mudaram)
+
+    def _limites_mudaram(self, ax):
+        if self.timer is None:
+            self.atualizar()
+        elif not self.agendado:
+            self.agendado = True
+            self.timer.start()
+
+    def _atualizar_agendado(self):
+        self.agendado = False
+        self.atualizar()
+        self.ax.figure.canvas.draw_idle()
+
+    def _visiveis(self, pontos):
+        x0, x1 = sorted(self.ax.get_xlim())
+        y0, y1 = sorted(self.ax.get_ylim())
+        dentro = (pontos[:, 0] >= x0) & (pontos[:, 0] <= x1) & (pontos[:, 1] >= y0) & (pontos[:, 1] <= y1)
+        return np.flatnonzero(dentro)
+
+    def _cabem(self):
+        largura_px = self.ax.get_window_extent().width
+        return min(self.limite, int(largura_px / PIXELS_POR_ROTULO))
+
+    def atualizar(self, ax=None):
+        for artista in self.artistas:
+            artista.remove()
+        self.artistas = []
+        cabem = self._cabem()
+
+        barras_visiveis = self._visiveis(self.meios)
+        if len(barras_visiveis) <= cabem:
+            for i in barras_visiveis:
+                # Ajuste fino para o texto não ficar em cima da linha
+                self.artistas.append(self.ax.text(
+                    self.meios[i, 0], self.meios[i, 1] + 0.05, self.textos_barras[i], color=self.cores_barras[i],
+                    fontsize=12, fontweight='bold', bbox=dict(facecolor='white', edgecolor='none', alpha=0.7),
+                    ha='center'))
+
+        nos_visiveis = self._visiveis(self.coords)
+        if len(nos_visiveis) <= cabem:
+            for i in nos_visiveis:
+                self.artistas.append(self.ax.text(self.coords[i, 0], self.coords[i, 1] - 0.2, f"Nó {i + 1}",
+                                                  ha='center', fontsize=9))
+
+
+def _desenhar_cargas(ax, coords, cargas, limite):
+    if not cargas:
+        return
+    nos = np.array(list(cargas.keys()))
+    vetores = np.array(list(cargas.values()), dtype=np.float64)
+
+    if len(nos) > min(limite, ax.get_window_extent().width / PIXELS_POR_ROTULO):
+        # Muitas cargas: uma única chamada, sem texto
+        direcao = vetores / np.linalg.norm(vetores, axis=1)[:, None]
+        ax.quiver(coords[nos, 0] - 0.8 * direcao[:, 0], coords[nos, 1] - 0.8 * direcao[:, 1],
+                  direcao[:, 0], direcao[:, 1], color='red', angles='xy', scale_units='xy', scale=1.25)
+        return
+
+    for no, (px, py) in zip(nos, vetores):
+        modulo = math.hypot(px, py)
+        dx, dy = px / modulo, py / modulo
+        nx, ny = coords[no]
+        ax.arrow(nx - 0.8 * dx, ny - 0.8 * dy, 0.6 * dx, 0.6 * dy, head_width=0.1, head_length=0.2,
+                 fc='red', ec='red', width=0.02)
+        ax.text(nx - 0.9 * dx, ny - 0.9 * dy, f"{modulo:g}", color='red', ha='center', fontweight='bold')
+
+
+def _desenhar_apoios(ax, coords, apoios):
+    # Apoio fixo: triângulo; apoio móvel: triângulo + bolinhas
+    for no, tipo in apoios.items():
+        nx, ny = coords[no]
+        ax.plot([nx, nx - 0.2, nx + 0.2, nx], [ny, ny - 0.2, ny - 0.2, ny], 'k-', linewidth=1)
+        if tipo == "movel":
+            ax.plot([nx - 0.1, nx + 0.1], [ny - 0.25, ny - 0.25], 'ko', markersize=4, linestyle='none')
+
+
+def desenhar_trelica(coords=None, barras=None, forcas=None, nomes=None, cargas=None, apoios=None,
+                     arquivo=None, formato=None, limite_rotulos=LIMITE_ROTULOS):
+    # Sem argumentos desenha a treliça do exercício, com as forças calculadas pelo método dos nós.
+    # Com `arquivo` (PNG/SVG ou arquivo aberto + `formato`) renderiza com Agg, sem display.
+    if coords is None:
+        coords, barras, nomes, cargas, apoios = trelica_exemplo()
+    coords = np.asarray(coords, dtype=np.float64)
+    barras = np.asarray(barras, dtype=np.int64)
+    cargas = cargas or {}
+    apoios = apoios or {}
+
+    if forcas is None and cargas and apoios:
+        forcas, _, _ = forcas_trelica(coords, barras, cargas, apoios)
+    if nomes is None:
+        nomes = [f"F{i + 1}" for i in range(len(barras))]
+
+    if arquivo is not None:
+        fig = Figure(figsize=(10, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+    else:
+        # pyplot (e o backend com janela) só quando for mostrar na tela
+        import matplotlib.pyplot as plt
+        fig, ax = plt.subplots(figsize=(10, 6))
+
+    # --- Barras: uma única coleção de segmentos, cor pela força ---
+    segmentos = coords[barras]
+    if forcas is not None:
+        cores = cores_por_forca(forcas)
+        textos = [f"{nome}: {f:.1f}" for nome, f in zip(nomes, forcas)]
+    else:
+        cores = np.full(len(barras), 'black', dtype=object)
+        textos = list(nomes)
+    polilinhas, cores_linhas = _linhas_por_cor(segmentos, cores)
+    ax.add_collection(LineCollection(polilinhas, colors=cores_linhas, linewidths=2, zorder=1))
+
+    # --- Nós: um único scatter ---
+    tamanho = 100 if len(coords) <= limite_rotulos else 16
+    ax.scatter(coords[:, 0], coords[:, 1], s=tamanho, c='black', zorder=2)
+
+    _desenhar_cargas(ax, coords, cargas, limite_rotulos)
+    _desenhar_apoios(ax, coords, apoios)
 
     # Configurações do Gráfico
+    ax.autoscale_view()
     ax.set_aspect('equal')
     ax.set_title("Mapa de Forças da Treliça", fontsize=16)
     ax.axis('off')  # Esconde eixos x/y numéricos
-    plt.tight_layout()
+
+    # A figura guarda a referência: os callbacks de zoom do matplotlib são referências fracas
+    fig.rotulos_por_zoom = RotulosPorZoom(ax, segmentos.mean(axis=1), textos, cores, coords, limite_rotulos)
+    fig.rotulos_por_zoom.atualizar()
+    fig.tight_layout()
+
+    if arquivo is not None:
+        fig.savefig(arquivo, format=formato)
+        return fig
+
     plt.show()
+    return fig
 
 
 # Executa
 if __name__ == "__main__":
-    desenhar_trelica()
\ No newline at end of file
+    desenhar_trelica()